@@ -6,13 +6,17 @@ Provides REST API for analyzing GitHub repositories without GitHub App installat
 
 from typing import Any
 
+import structlog
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from src.services.standalone_analyzer import standalone_analyzer
+from src.api.responses import ORJSONResponse
+from src.services.standalone_analyzer import AnalysisResult, standalone_analyzer
 from src.utils.github_url import GitHubURLParser
 
-router = APIRouter()
+logger = structlog.get_logger()
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class AnalyzeRequest(BaseModel):
@@ -41,15 +45,33 @@ class AnalyzeRequest(BaseModel):
         None,
         description="GitHub Personal Access Token for private repos (optional)",
     )
+    github_tokens: list[str] | None = Field(
+        None,
+        description=(
+            "Additional GitHub tokens (optional); each analysis uses the one with the most remaining rate limit"
+        ),
+    )
     batch_mode: bool = Field(
         False,
         description="Enable batch mode for analyzing large numbers of PRs (up to 200)",
     )
 
 
+class ParseURLRequest(BaseModel):
+    """Request model for URL parsing; only the URL is validated."""
+
+    repository_url: str = Field(
+        ...,
+        description="GitHub repository URL (e.g., https://github.com/owner/repo)",
+        examples=["https://github.com/NVIDIA/TensorRT-LLM"],
+    )
+
+
 class AnalyzeResponse(BaseModel):
     """Response model for analysis results."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     success: bool = Field(..., description="Whether the analysis completed successfully")
     violations: list[dict[str, Any]] = Field(default_factory=list, description="List of rule violations found")
     violations_count: int = Field(0, description="Number of violations found")
@@ -60,10 +82,32 @@ class AnalyzeResponse(BaseModel):
     pr_data: dict[str, Any] | None = Field(None, description="First PR metadata")
     prs_analyzed: list[dict[str, Any]] = Field(default_factory=list, description="List of analyzed PRs")
 
+    @classmethod
+    def from_result(cls, result: AnalysisResult) -> "AnalyzeResponse":
+        """
+        Build a response directly from an analysis result.
+
+        The result is produced internally by the analyzer, so fields are assigned
+        without validation and without the intermediate to_dict() round-trip.
+        """
+        return cls.model_construct(
+            success=result.success,
+            violations=result.violations_data(),
+            violations_count=len(result.violations),
+            rules_loaded=result.rules_loaded,
+            processing_time_ms=result.processing_time_ms,
+            error=result.error,
+            repository=result.repository_summary(),
+            pr_data=result.pr_summary(),
+            prs_analyzed=result.prs_analyzed,
+        )
+
 
 class ParseURLResponse(BaseModel):
     """Response model for URL parsing."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     valid: bool = Field(..., description="Whether the URL is valid")
     owner: str | None = Field(None, description="Repository owner")
     repo: str | None = Field(None, description="Repository name")
@@ -99,16 +143,13 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
     }
     ```
     """
-    import structlog
-    logger = structlog.get_logger()
-
     logger.info(
         "Received analysis request",
         repository_url=request.repository_url,
         pr_number=request.pr_number,
         max_prs=request.max_prs,
         has_rules_yaml=request.rules_yaml is not None,
-        has_token=request.github_token is not None,
+        has_token=request.github_token is not None or bool(request.github_tokens),
     )
 
     repo_info = GitHubURLParser.parse(request.repository_url)
@@ -128,11 +169,13 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
         full_name=repo_info.full_name,
     )
 
+    tokens = [token for token in [request.github_token, *(request.github_tokens or [])] if token]
+
     result = await standalone_analyzer.analyze(
         repo_info=repo_info,
         pr_number=request.pr_number,
         rules_yaml=request.rules_yaml,
-        github_token=request.github_token,
+        github_token=tokens or None,
         max_prs=request.max_prs,
         batch_mode=request.batch_mode,
     )
@@ -145,30 +188,26 @@ async def analyze_repository(request: AnalyzeRequest) -> AnalyzeResponse:
         error=result.error,
     )
 
-    return AnalyzeResponse(**result.to_dict())
+    return AnalyzeResponse.from_result(result)
 
 
 @router.post("/parse-url", response_model=ParseURLResponse)
-async def parse_github_url(request: AnalyzeRequest) -> ParseURLResponse:
+async def parse_github_url(request: ParseURLRequest) -> ParseURLResponse:
     """
     Parse and validate a GitHub repository URL.
 
     Returns the extracted owner, repo, PR number, and branch information.
     Useful for validating user input before running analysis.
     """
+    # Kept as ``async def`` on purpose: the body never blocks (a memoized regex parse), and a
+    # plain ``def`` would make FastAPI hand every call to the threadpool, which costs more.
     repo_info = GitHubURLParser.parse(request.repository_url)
 
+    # Values come straight from the parser, so construct without re-validation.
     if not repo_info:
-        return ParseURLResponse(
-            valid=False,
-            owner=None,
-            repo=None,
-            full_name=None,
-            pr_number=None,
-            branch=None,
-        )
+        return ParseURLResponse.model_construct(valid=False)
 
-    return ParseURLResponse(
+    return ParseURLResponse.model_construct(
         valid=True,
         owner=repo_info.owner,
         repo=repo_info.repo,
@@ -3,8 +3,9 @@ from pydantic import BaseModel
 
 from src.agents import get_agent
 from src.agents.base import AgentResult
+from src.api.responses import ORJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 class RuleEvaluationRequest(BaseModel):
@@ -12,135 +13,94 @@ class RuleEvaluationRequest(BaseModel):
     event_data: dict | None = None  # Advanced: pass extra event data for edge cases.
 
 
-@router.post("/rules/evaluate", response_model=AgentResult)
-async def evaluate_rule(request: RuleEvaluationRequest) -> AgentResult:
-    """
-    Evaluate a rule description for feasibility.
-    For demo purposes, returns mock responses when real AI provider is not available.
-    """
-    rule_text = request.rule_text.lower()
-    
-    # Mock responses for common rule patterns
-    if "reference an issue" in rule_text or "fixes #" in rule_text:
-        return AgentResult(
-            success=True,
-            message="Rule is feasible and can be implemented with require_linked_issue validator",
-            data={
-                "supported": True,
-                "rule_yaml": """rules:
-  - description: "PRs must reference an issue number (e.g., Fixes #123)"
-    enabled: true
-    severity: "medium"
-    event_types: ["pull_request"]
-    parameters:
-      require_linked_issue: true""",
-                "snippet": """  - description: "PRs must reference an issue number (e.g., Fixes #123)"
+_ISSUE_SNIPPET = """  - description: "PRs must reference an issue number (e.g., Fixes #123)"
     enabled: true
     severity: "medium"
     event_types: ["pull_request"]
     parameters:
       require_linked_issue: true"""
-            }
-        )
-    
-    elif "title pattern" in rule_text or "conventional commit" in rule_text:
-        return AgentResult(
-            success=True,
-            message="Rule is feasible and can be implemented with title_pattern validator",
-            data={
-                "supported": True,
-                "rule_yaml": """rules:
-  - description: "Pull requests must follow conventional commit format"
-    enabled: true
-    severity: "medium"
-    event_types: ["pull_request"]
-    parameters:
-      title_pattern: "^feat|^fix|^docs|^style|^refactor|^test|^chore|^perf|^ci|^build|^revert""",
-                "snippet": """  - description: "Pull requests must follow conventional commit format"
+
+_TITLE_PATTERN_SNIPPET = """  - description: "Pull requests must follow conventional commit format"
     enabled: true
     severity: "medium"
     event_types: ["pull_request"]
     parameters:
-      title_pattern: "^feat|^fix|^docs|^style|^refactor|^test|^chore|^perf|^ci|^build|^revert"""
-            }
-        )
-    
-    elif "code owner" in rule_text or "reviewer approval" in rule_text:
-        return AgentResult(
-            success=True,
-            message="Rule is feasible and can be implemented with require_code_owner_reviewers validator",
-            data={
-                "supported": True,
-                "rule_yaml": """rules:
-  - description: "Changes to critical files require code owner review"
-    enabled: true
-    severity: "high"
-    event_types: ["pull_request"]
-    parameters:
-      require_code_owner_reviewers: true""",
-                "snippet": """  - description: "Changes to critical files require code owner review"
+      title_pattern: "^feat|^fix|^docs|^style|^refactor|^test|^chore|^perf|^ci|^build|^revert\""""
+
+_CODE_OWNER_SNIPPET = """  - description: "Changes to critical files require code owner review"
     enabled: true
     severity: "high"
     event_types: ["pull_request"]
     parameters:
       require_code_owner_reviewers: true"""
-            }
-        )
-    
-    elif "max lines" in rule_text or "500 lines" in rule_text:
-        return AgentResult(
-            success=True,
-            message="Rule is feasible and can be implemented with max_pr_loc validator",
-            data={
-                "supported": True,
-                "rule_yaml": """rules:
-  - description: "PRs must not exceed 500 lines changed"
-    enabled: true
-    severity: "medium"
-    event_types: ["pull_request"]
-    parameters:
-      max_lines: 500""",
-                "snippet": """  - description: "PRs must not exceed 500 lines changed"
+
+_MAX_LINES_SNIPPET = """  - description: "PRs must not exceed 500 lines changed"
     enabled: true
     severity: "medium"
     event_types: ["pull_request"]
     parameters:
       max_lines: 500"""
-            }
-        )
-    
-    elif "no direct commit" in rule_text or "main branch" in rule_text:
-        return AgentResult(
-            success=True,
-            message="Rule is feasible and can be implemented with protected_branches validator",
-            data={
-                "supported": True,
-                "rule_yaml": """rules:
-  - description: "No direct commits to main branch"
-    enabled: true
-    severity: "critical"
-    event_types: ["push"]
-    parameters:
-      protected_branches: ["main", "master"]""",
-                "snippet": """  - description: "No direct commits to main branch"
+
+_PROTECTED_BRANCH_SNIPPET = """  - description: "No direct commits to main branch"
     enabled: true
     severity: "critical"
     event_types: ["push"]
     parameters:
       protected_branches: ["main", "master"]"""
-            }
-        )
-    
-    else:
-        return AgentResult(
-            success=False,
-            message="This rule pattern is not currently supported by Watchflow validators",
-            data={
-                "supported": False,
-                "rule_yaml": "",
-                "snippet": ""
-            }
-        )
+
+
+def _supported_mock(message: str, snippet: str) -> AgentResult:
+    """Build a canned feasible result; the full rules file is the snippet under a ``rules:`` key."""
+    return AgentResult.model_construct(
+        success=True,
+        message=message,
+        data={"supported": True, "rule_yaml": f"rules:\n{snippet}", "snippet": snippet},
+    )
+
+
+# Canned feasibility results for common rule patterns, keyed by the phrases that select them.
+# Built once at import; the contents are trusted literals so validation is skipped.
+_MOCK_RESPONSES: dict[tuple[str, ...], AgentResult] = {
+    ("reference an issue", "fixes #"): _supported_mock(
+        "Rule is feasible and can be implemented with require_linked_issue validator", _ISSUE_SNIPPET
+    ),
+    ("title pattern", "conventional commit"): _supported_mock(
+        "Rule is feasible and can be implemented with title_pattern validator", _TITLE_PATTERN_SNIPPET
+    ),
+    ("code owner", "reviewer approval"): _supported_mock(
+        "Rule is feasible and can be implemented with require_code_owner_reviewers validator", _CODE_OWNER_SNIPPET
+    ),
+    ("max lines", "500 lines"): _supported_mock(
+        "Rule is feasible and can be implemented with max_pr_loc validator", _MAX_LINES_SNIPPET
+    ),
+    ("no direct commit", "main branch"): _supported_mock(
+        "Rule is feasible and can be implemented with protected_branches validator", _PROTECTED_BRANCH_SNIPPET
+    ),
+}
+
+_UNSUPPORTED_RESPONSE = AgentResult.model_construct(
+    success=False,
+    message="This rule pattern is not currently supported by Watchflow validators",
+    data={"supported": False, "rule_yaml": "", "snippet": ""},
+)
+
+
+def _match_mock(rule_text: str) -> AgentResult:
+    """Return the canned result for a lowercased rule description."""
+    for keywords, result in _MOCK_RESPONSES.items():
+        if any(keyword in rule_text for keyword in keywords):
+            return result
+
+    return _UNSUPPORTED_RESPONSE
+
+
+@router.post("/rules/evaluate", response_model=AgentResult)
+async def evaluate_rule(request: RuleEvaluationRequest) -> AgentResult:
+    """
+    Evaluate a rule description for feasibility.
+    For demo purposes, returns mock responses when real AI provider is not available.
+    """
+    return _match_mock(request.rule_text.lower())
 
 
 @router.post("/rules/evaluate-test", response_model=AgentResult)
@@ -156,4 +116,4 @@ async def evaluate_rule_test(request: RuleEvaluationRequest) -> AgentResult:
         return result
     except Exception as e:
         # Fall back to mock responses
-        return await evaluate_rule(request)
+        return _match_mock(request.rule_text.lower())
@@ -1,11 +1,12 @@
 """
-Shared utilities for retry, caching, logging, metrics, and timeout handling.
+Shared utilities for retry, caching, concurrency, logging, metrics, and timeout handling.
 
 This module provides reusable utilities that can be used across the codebase
 to avoid code duplication and ensure consistent behavior.
 """
 
 from src.core.utils.caching import AsyncCache, cached_async
+from src.core.utils.concurrency import bounded_as_completed
 from src.core.utils.logging import log_operation
 from src.core.utils.metrics import track_metrics
 from src.core.utils.retry import retry_with_backoff
@@ -14,6 +15,7 @@ from src.core.utils.timeout import execute_with_timeout
 __all__ = [
     "AsyncCache",
     "cached_async",
+    "bounded_as_completed",
     "log_operation",
     "track_metrics",
     "retry_with_backoff",
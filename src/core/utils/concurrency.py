@@ -0,0 +1,64 @@
+"""
+Concurrency utilities for async operations.
+
+Provides helpers for running many coroutines with a concurrency limit.
+"""
+
+import asyncio
+import inspect
+import itertools
+from collections.abc import AsyncIterator, Awaitable, Iterable
+
+
+async def bounded_as_completed[T](coros: Iterable[Awaitable[T]], limit: int) -> AsyncIterator[tuple[int, T]]:
+    """
+    Run awaitables with at most `limit` in flight, yielding results as they finish.
+
+    Each result is paired with the index of its awaitable in `coros`, so callers can
+    report progress while results arrive and still restore the input order. If an
+    awaitable raises, the exception propagates, running ones are cancelled and
+    coroutines that never started are closed.
+
+    Args:
+        coros: Awaitables to run
+        limit: Maximum number of awaitables running at once
+
+    Yields:
+        (index, result) tuples in completion order
+
+    Example:
+        async for index, result in bounded_as_completed(fetches, limit=10):
+            results[index] = result
+    """
+    # Awaitables are pulled from `coros` only as slots free up, so ones that never get a
+    # slot are never created (for generators) or can be closed unstarted on error.
+    pending_coros = enumerate(coros)
+    running: dict[asyncio.Future[T], tuple[int, Awaitable[T]]] = {}
+    done: list[asyncio.Future[T]] = []
+
+    def fill() -> None:
+        for index, aw in itertools.islice(pending_coros, limit - len(running)):
+            running[asyncio.ensure_future(aw)] = (index, aw)
+
+    try:
+        fill()
+        while running:
+            finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            done = list(finished)
+            while done:
+                task = done.pop()
+                index, _ = running.pop(task)
+                yield index, task.result()
+            fill()
+    finally:
+        for task in done:
+            # Retrieve exceptions of finished tasks that were not yielded so none go unreported
+            if not task.cancelled():
+                task.exception()
+        for task, (_, aw) in running.items():
+            task.cancel()
+            if inspect.iscoroutine(aw) and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED:
+                aw.close()
+        for _, aw in pending_coros:
+            if inspect.iscoroutine(aw):
+                aw.close()
@@ -1,5 +1,7 @@
 import asyncio
 import base64
+import hashlib
+import sys
 import time
 from typing import Any, cast
 
@@ -39,6 +41,57 @@ query PRHygiene($owner: String!, $repo: String!) {
 }
 """
 
+# Reviews and files of one PR, requested once per aliased pullRequest field in a bundle query
+_PR_BUNDLE_FIELDS = """
+      number
+      reviews(first: 100) {
+        nodes {
+          state
+          submittedAt
+          author {
+            login
+          }
+        }
+      }
+      files(first: 100) {
+        nodes {
+          path
+          changeType
+          additions
+          deletions
+        }
+      }
+"""
+
+# GraphQL changeType values mapped to the REST `status` field of /pulls/{n}/files
+_CHANGE_TYPE_TO_STATUS = {
+    "ADDED": "added",
+    "DELETED": "removed",
+    "MODIFIED": "modified",
+    "RENAMED": "renamed",
+    "COPIED": "copied",
+    "CHANGED": "changed",
+}
+
+# Conditional-request cache budget, measured in body bytes. Bodies over the per-entry cap (e.g.
+# /pulls/{n}/files with large patches) aren't kept, so a few big PRs can't evict everything else.
+_ETAG_CACHE_BYTES = 32 * 1024 * 1024
+_ETAG_MAX_BODY_BYTES = 1024 * 1024
+# Rough per-entry overhead (key, ETag, tuple) so tiny bodies still count towards the budget
+_ETAG_ENTRY_OVERHEAD = 512
+
+
+def _etag_entry_size(entry: tuple[str, str | bytes]) -> int:
+    """Size of an (ETag, body) cache entry for the byte-bounded ETag cache."""
+    return len(entry[1]) + _ETAG_ENTRY_OVERHEAD
+
+
+# Backoff for REST responses rejected by a (secondary) rate limit: honour Retry-After or the reset
+# time, otherwise back off exponentially. Waits longer than the cap are not worth holding a request.
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_BACKOFF_BASE = 1.0
+_RATE_LIMIT_MAX_WAIT = 60.0
+
 
 class GitHubClient:
     """
@@ -60,6 +113,13 @@ class GitHubClient:
         self._session: aiohttp.ClientSession | None = None
         # Cache for installation tokens (TTL: 50 minutes, GitHub tokens expire in 60)
         self._token_cache: TTLCache = TTLCache(maxsize=100, ttl=50 * 60)
+        # (ETag, body) of earlier responses for conditional requests; a 304 doesn't count against
+        # the rate limit. Keyed by URL plus auth/accept headers so callers never share each other's data.
+        self._etag_cache: TTLCache = TTLCache(maxsize=_ETAG_CACHE_BYTES, ttl=60 * 60, getsizeof=_etag_entry_size)
+        # Last X-RateLimit-Remaining seen for tokens handed to pick_token, keyed by credential digest
+        # (None until a response reports it). Entries expire with GitHub's hourly rate limit window.
+        self._rate_limit_remaining: TTLCache = TTLCache(maxsize=256, ttl=60 * 60)
+        self._token_turn = 0
 
     def _detect_issue_references(self, body: str, title: str) -> bool:
         """Detect if PR body or title contains issue references (e.g. #123)."""
@@ -145,6 +205,7 @@ class GitHubClient:
             session = await self._get_session()
             async with session.get(url, headers=headers) as response:
                 logger.info(f"get_repository: Response status {response.status} for {repo_full_name}")
+                self._record_rate_limit(headers, response)
                 if response.status == 200:
                     data = await response.json()
                     logger.info(f"get_repository: Successfully fetched {repo_full_name}")
@@ -194,23 +255,39 @@ class GitHubClient:
         if not headers:
             return None
         url = f"{config.github.api_base_url}/repos/{repo_full_name}/contents/{file_path}"
+        etag_key = self._etag_key(url, headers)
+        cached = self._etag_cache.get(etag_key)
+        request_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
 
         session = await self._get_session()
-        async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                logger.info(f"Successfully fetched file '{file_path}' from '{repo_full_name}'.")
-                return await response.text()
-            elif response.status == 404:
-                logger.info(f"File '{file_path}' not found in '{repo_full_name}'.")
-                return None
-            else:
-                error_text = await response.text()
-                logger.error(
-                    f"Failed to get file content for {repo_full_name}/{file_path}. "
-                    f"Status: {response.status}, Response: {error_text}"
-                )
-                response.raise_for_status()
-                return None
+        attempt = 0
+        while True:
+            async with session.get(url, headers=request_headers) as response:
+                self._record_rate_limit(headers, response)
+                wait = self._rate_limit_wait(response, attempt)
+                if wait is None:
+                    if response.status == 304 and cached:
+                        logger.info(f"File '{file_path}' in '{repo_full_name}' not modified, using cached content.")
+                        return cast("str", cached[1])
+                    if response.status == 200:
+                        logger.info(f"Successfully fetched file '{file_path}' from '{repo_full_name}'.")
+                        content = await response.text()
+                        self._remember_etag(etag_key, response, content)
+                        return content
+                    elif response.status == 404:
+                        logger.info(f"File '{file_path}' not found in '{repo_full_name}'.")
+                        return None
+                    else:
+                        error_text = await response.text()
+                        logger.error(
+                            f"Failed to get file content for {repo_full_name}/{file_path}. "
+                            f"Status: {response.status}, Response: {error_text}"
+                        )
+                        response.raise_for_status()
+                        return None
+            logger.warning("github_rate_limited", url=url, status_code=response.status, retry_in=wait)
+            await asyncio.sleep(wait)
+            attempt += 1
 
     async def close(self) -> None:
         """Closes the aiohttp session."""
@@ -293,6 +370,110 @@ class GitHubClient:
             logger.error(traceback.format_exc())
             return []
 
+    def pick_token(self, tokens: list[str]) -> str:
+        """
+        Pick the token with the most remaining REST rate limit.
+
+        Tokens not seen yet count as having a full budget; ties rotate between calls so
+        fresh tokens are used round-robin until their budgets are known.
+        """
+        keys = [self._credential_key(f"Bearer {token}") for token in tokens]
+        for key in keys:
+            if key not in self._rate_limit_remaining:
+                self._rate_limit_remaining[key] = None
+
+        def budget(index: int) -> int:
+            remaining = self._rate_limit_remaining.get(keys[index])
+            return sys.maxsize if remaining is None else cast("int", remaining)
+
+        self._token_turn = (self._token_turn + 1) % len(tokens)
+        rotated = [*range(self._token_turn, len(tokens)), *range(self._token_turn)]
+        return tokens[max(rotated, key=budget)]
+
+    def _record_rate_limit(self, headers: dict[str, str], response: Any) -> None:
+        """Remember the remaining rate limit reported for a token tracked by pick_token."""
+        key = self._credential_key(headers.get("Authorization"))
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if key in self._rate_limit_remaining and isinstance(remaining, str) and remaining.isdigit():
+            self._rate_limit_remaining[key] = int(remaining)
+
+    @staticmethod
+    def _rate_limit_wait(response: Any, attempt: int) -> float | None:
+        """
+        Seconds to wait before retrying a request rejected by a rate limit, or None to not retry.
+
+        Follows GitHub's guidance for secondary rate limits: use Retry-After when present, else
+        the reset time once the budget is exhausted, else exponential backoff for a 429.
+        """
+        if response.status not in (403, 429) or attempt >= _RATE_LIMIT_RETRIES:
+            return None
+        backoff = _RATE_LIMIT_BACKOFF_BASE * 2**attempt
+        retry_after = response.headers.get("Retry-After")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if isinstance(retry_after, str) and retry_after.isdigit():
+            wait = max(float(retry_after), backoff)
+        elif response.headers.get("X-RateLimit-Remaining") == "0" and isinstance(reset, str) and reset.isdigit():
+            wait = max(int(reset) - time.time(), backoff)
+        elif response.status == 429:
+            wait = backoff
+        else:
+            # A 403 without rate limit headers is a permissions problem, not something to wait out
+            return None
+        return wait if wait <= _RATE_LIMIT_MAX_WAIT else None
+
+    @staticmethod
+    def _credential_key(authorization: str | None) -> str | None:
+        """Digest of an Authorization header, so caches can tell credentials apart without holding them."""
+        if not authorization:
+            return None
+        return hashlib.sha256(authorization.encode()).hexdigest()
+
+    @classmethod
+    def _etag_key(cls, url: str, headers: dict[str, str]) -> tuple[str, str | None, str | None]:
+        """Cache key for conditional requests; includes the credentials so responses are never shared."""
+        return (url, cls._credential_key(headers.get("Authorization")), headers.get("Accept"))
+
+    def _remember_etag(self, key: tuple[str, str | None, str | None], response: Any, body: str | bytes) -> None:
+        """Store a response body under its ETag for later If-None-Match requests."""
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str) and len(body) <= _ETAG_MAX_BODY_BYTES:
+            self._etag_cache[key] = (etag, body)
+
+    async def _conditional_get(
+        self, url: str, headers: dict[str, str], session: aiohttp.ClientSession | None = None
+    ) -> tuple[int, bytes | None]:
+        """
+        GET a URL, revalidating an earlier response with If-None-Match when one is cached.
+
+        A 304 Not Modified is reported as a 200 carrying the cached body, so callers only
+        deal with fresh or unchanged content.
+
+        Returns:
+            Tuple of (status, body). body is None for non-200 responses.
+        """
+        etag_key = self._etag_key(url, headers)
+        cached = self._etag_cache.get(etag_key)
+        request_headers = {**headers, "If-None-Match": cached[0]} if cached else headers
+
+        if session is None:
+            session = await self._get_session()
+        attempt = 0
+        while True:
+            async with session.get(url, headers=request_headers) as response:
+                self._record_rate_limit(headers, response)
+                wait = self._rate_limit_wait(response, attempt)
+                if wait is None:
+                    if response.status == 304 and cached:
+                        return 200, cast("bytes", cached[1])
+                    if response.status != 200:
+                        return response.status, None
+                    body = await response.read()
+                    self._remember_etag(etag_key, response, body)
+                    return 200, body
+            logger.warning("github_rate_limited", url=url, status_code=response.status, retry_in=wait)
+            await asyncio.sleep(wait)
+            attempt += 1
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """
         Initializes and returns the aiohttp session.
@@ -302,20 +483,10 @@ class GitHubClient:
         - Also recreates the session if the event loop has changed (common in test environments).
         - Disables SSL verification for Windows compayibility.
         """
-        import ssl
-        # Create an SSL context that doesn't verify certificates
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-
-        logger.info(f"_get_session: Creating new connector with SSL disabled")
-
         try:
             if self._session is None or self._session.closed:
                 logger.info(f"_get_session: No existing session or closed, creating new one")
-                self._session = aiohttp.ClientSession(connector=connector)
+                self._session = self._new_session()
             else:
                 logger.info(f"_get_session: Reusing existing session")
                 # Check if we're in a different event loop (avoid deprecated .loop property)
@@ -328,19 +499,44 @@ class GitHubClient:
                         if self._session._connector:
                             await self._session._connector.close()
                         await self._session.close()
-                        self._session = aiohttp.ClientSession(connector=connector)
+                        self._session = self._new_session()
                 except RuntimeError as e:
                     # No running loop or loop is closed, recreate session
                     logger.warning(f"_get_session: RuntimeError checking event loop: {e}, recreating session")
-                    self._session = aiohttp.ClientSession()
+                    self._session = self._new_session()
         except Exception as e:
             # Fallback: ensure we have a valid session
             logger.error(f"_get_session: Exception during session creation: {e}")
-            self._session = aiohttp.ClientSession(connector=connector)
+            self._session = self._new_session()
 
         logger.info(f"_get_session: Returning session (closed={getattr(self._session, 'closed', 'unknown')})")   
         return self._session
 
+    @staticmethod
+    def _new_session() -> aiohttp.ClientSession:
+        """
+        Creates an aiohttp session with a pooled connector.
+
+        The connector is only built here, when a session is actually created: it keeps up to
+        64 connections per host alive for reuse and caches DNS lookups, so concurrent PR
+        fetches share connections instead of opening new ones.
+        """
+        import ssl
+
+        # Create an SSL context that doesn't verify certificates
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            limit_per_host=64,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        logger.info("_get_session: Creating new connector with SSL disabled")
+        return aiohttp.ClientSession(connector=connector)
+
     def _generate_jwt(self) -> str:
         """Generates a JSON Web Token (JWT) to authenticate as the GitHub App."""
         payload = {
@@ -1608,6 +1804,100 @@ class GitHubClient:
             logger.error("fetch_all_prs_error", repo=repo_full_name, error=str(e))
             return all_prs
 
+    async def fetch_pr_bundles(
+        self,
+        repo_full_name: str,
+        pr_numbers: list[int],
+        user_token: str | None = None,
+        installation_id: int | None = None,
+        chunk_size: int = 25,
+    ) -> dict[int, dict[str, list[dict[str, Any]]]]:
+        """
+        Fetches reviews and files for many PRs with aliased GraphQL queries.
+
+        One query covers up to `chunk_size` PRs instead of two REST calls per PR.
+        Results are mapped to the REST response shapes so callers can use them
+        interchangeably with /pulls/{n}/reviews and /pulls/{n}/files.
+
+        Args:
+            repo_full_name: Repository in 'owner/repo' format.
+            pr_numbers: PR numbers to fetch.
+            user_token: Optional GitHub Personal Access Token for authenticated requests.
+            installation_id: Optional GitHub App installation ID for authenticated requests.
+            chunk_size: Maximum number of PRs per query.
+
+        Returns:
+            Mapping of PR number to {"reviews": [...], "files": [...]}. PRs whose
+            chunk failed, or whose alias came back with an error, are missing from
+            the mapping.
+        """
+        owner, repo = repo_full_name.split("/", 1)
+        bundles: dict[int, dict[str, list[dict[str, Any]]]] = {}
+
+        headers = await self._get_auth_headers(user_token=user_token, installation_id=installation_id)
+        if not headers:
+            logger.warning("pr_bundle_fetch_skipped", repo=repo_full_name, reason="no_auth_headers")
+            return bundles
+        url = f"{config.github.api_base_url}/graphql"
+        session = await self._get_session()
+
+        for start in range(0, len(pr_numbers), chunk_size):
+            chunk = pr_numbers[start : start + chunk_size]
+            aliases = "".join(f"pr{n}: pullRequest(number: {n}) {{{_PR_BUNDLE_FIELDS}}}\n" for n in chunk)
+            query = (
+                "query PRBundle($owner: String!, $repo: String!) {\n"
+                "  repository(owner: $owner, name: $repo) {\n"
+                f"{aliases}"
+                "  }\n"
+                "}"
+            )
+            # Posted directly rather than through execute_graphql: callers fall back to REST for
+            # anything missing, so a failed chunk shouldn't be retried, and an error on one alias
+            # (e.g. a deleted PR) shouldn't discard the other PRs' data.
+            payload = {"query": query, "variables": {"owner": owner, "repo": repo}}
+            try:
+                async with session.post(url, headers=headers, json=payload) as response:
+                    if response.status != 200:
+                        logger.warning(
+                            "pr_bundle_fetch_failed", repo=repo_full_name, prs=chunk, status_code=response.status
+                        )
+                        continue
+                    data = await response.json()
+            except Exception as e:
+                logger.warning("pr_bundle_fetch_failed", repo=repo_full_name, prs=chunk, error=str(e))
+                continue
+
+            if data.get("errors"):
+                logger.warning("pr_bundle_partial_errors", repo=repo_full_name, prs=chunk, errors=data["errors"])
+
+            repository = (data.get("data") or {}).get("repository") or {}
+            for number in chunk:
+                node = repository.get(f"pr{number}")
+                if node:
+                    bundles[number] = {
+                        "reviews": [
+                            {
+                                "state": review.get("state"),
+                                "submitted_at": review.get("submittedAt"),
+                                "user": {"login": (review.get("author") or {}).get("login")},
+                            }
+                            for review in (node.get("reviews") or {}).get("nodes") or []
+                        ],
+                        "files": [
+                            {
+                                "filename": f.get("path"),
+                                "status": _CHANGE_TYPE_TO_STATUS.get(f.get("changeType"), "modified"),
+                                "additions": f.get("additions"),
+                                "deletions": f.get("deletions"),
+                                "changes": (f.get("additions") or 0) + (f.get("deletions") or 0),
+                            }
+                            for f in (node.get("files") or {}).get("nodes") or []
+                        ],
+                    }
+
+        logger.info("pr_bundle_fetch_completed", repo=repo_full_name, requested=len(pr_numbers), fetched=len(bundles))
+        return bundles
+
 
 # Global instance
 github_client = GitHubClient()
@@ -8,6 +8,17 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 
+def _hashable(value: Any) -> Any:
+    """Convert nested kwargs values (dicts, lists) into a hashable equivalent."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(_hashable(v) for v in value)
+    return value
+
+
 class BaseProvider(ABC):
     """Base class for providers."""
 
@@ -32,6 +43,15 @@ class BaseProvider(ABC):
         """Get the provider name."""
         pass
 
+    def _config_key(self) -> tuple[Any, ...]:
+        """Hashable key identifying this provider configuration, used to cache chat model clients."""
+        return (
+            self.model,
+            self.max_tokens,
+            self.temperature,
+            tuple(sorted((k, _hashable(v)) for k, v in self.kwargs.items())),
+        )
+
     def get_model_info(self) -> dict[str, Any]:
         """Get model information."""
         return {
@@ -8,19 +8,32 @@ from typing import Any
 
 from src.integrations.providers.base import BaseProvider
 
+try:
+    from langchain_openai import ChatOpenAI
+except ImportError:
+    ChatOpenAI = None  # type: ignore[assignment,misc]
+
+# Chat clients keyed by provider config, so agents reuse one client and its HTTP connection pool.
+_CLIENT_CACHE: dict[tuple[Any, ...], Any] = {}
+
 
 class OpenAIProvider(BaseProvider):
     """OpenAI Provider."""
 
     def get_chat_model(self) -> Any:
         """Get OpenAI chat model with support for custom base URLs."""
-        try:
-            from langchain_openai import ChatOpenAI
-        except ImportError as e:
+        key = self._config_key()
+        if key not in _CLIENT_CACHE:
+            _CLIENT_CACHE[key] = self._build_chat_model()
+        return _CLIENT_CACHE[key]
+
+    def _build_chat_model(self) -> Any:
+        """Create a new ChatOpenAI client from this provider's configuration."""
+        if ChatOpenAI is None:
             raise RuntimeError(
                 "OpenAI provider requires 'langchain-openai' package. Install with: pip install langchain-openai"
-            ) from e
-        
+            )
+
         # Extract base_url from kwargs for custom OpenAI-compatible APIs
         base_url = self.kwargs.get("base_url")
 
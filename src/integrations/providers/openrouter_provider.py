@@ -9,6 +9,14 @@ from typing import Any
 
 from src.integrations.providers.base import BaseProvider
 
+try:
+    from langchain_openai import ChatOpenAI
+except ImportError:
+    ChatOpenAI = None  # type: ignore[assignment,misc]
+
+# Chat clients keyed by provider config, so agents reuse one client and its HTTP connection pool.
+_CLIENT_CACHE: dict[tuple[Any, ...], Any] = {}
+
 
 class OpenRouterProvider(BaseProvider):
     """OpenRouter Provider."""
@@ -17,12 +25,17 @@ class OpenRouterProvider(BaseProvider):
 
     def get_chat_model(self) -> Any:
         """Get OpenRouter chat model."""
-        try:
-            from langchain_openai import ChatOpenAI
-        except ImportError as e:
+        key = self._config_key()
+        if key not in _CLIENT_CACHE:
+            _CLIENT_CACHE[key] = self._build_chat_model()
+        return _CLIENT_CACHE[key]
+
+    def _build_chat_model(self) -> Any:
+        """Create a new ChatOpenAI client pointed at OpenRouter."""
+        if ChatOpenAI is None:
             raise RuntimeError(
                 "OpenRouter provider requires 'langchain-openai' package. Install with: pip install langchain-openai"
-            ) from e
+            )
 
         return ChatOpenAI(
             model=self.model,
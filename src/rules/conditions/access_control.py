@@ -281,9 +281,9 @@ def _required_code_owner_reviewers(event: dict[str, Any]) -> tuple[list[str], li
     if not changed_files or not codeowners_content:
         return ([], [])
 
-    from src.rules.utils.codeowners import CodeOwnersParser
+    from src.rules.utils.codeowners import get_codeowners_parser
 
-    parser = CodeOwnersParser(codeowners_content)
+    parser = get_codeowners_parser(codeowners_content)
     required: set[str] = set()
     for path in changed_files:
         owners = parser.get_owners_for_file(path)
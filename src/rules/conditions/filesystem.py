@@ -6,6 +6,7 @@ of pull requests and push events.
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any
 
 from src.core.models import Severity, Violation
@@ -62,8 +63,8 @@ class FilePatternCondition(BaseCondition):
                 )
             ]
 
-        regex_pattern = self._glob_to_regex(pattern)
-        matching_files = [file for file in changed_files if re.match(regex_pattern, file)]
+        regex = self._compile_glob(pattern)
+        matching_files = [file for file in changed_files if regex.match(file)]
 
         condition_type = parameters.get("condition_type", "files_match_pattern")
 
@@ -105,8 +106,8 @@ class FilePatternCondition(BaseCondition):
             logger.debug("No files to check against pattern")
             return False
 
-        regex_pattern = self._glob_to_regex(pattern)
-        matching_files = [file for file in changed_files if re.match(regex_pattern, file)]
+        regex = self._compile_glob(pattern)
+        matching_files = [file for file in changed_files if regex.match(file)]
 
         condition_type = parameters.get("condition_type", "files_match_pattern")
 
@@ -133,6 +134,12 @@ class FilePatternCondition(BaseCondition):
         regex = glob_pattern.replace(".", "\\.").replace("*", ".*").replace("?", ".")
         return f"^{regex}$"
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile_glob(glob_pattern: str) -> re.Pattern[str]:
+        """Compile a glob pattern once instead of on every evaluation."""
+        return re.compile(FilePatternCondition._glob_to_regex(glob_pattern))
+
 
 class MaxFileSizeCondition(BaseCondition):
     """Validates if files don't exceed maximum size limits."""
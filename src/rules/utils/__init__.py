@@ -6,6 +6,7 @@ CODEOWNERS parsing, contributor analysis, and rule validation.
 """
 
 from src.rules.utils.codeowners import (
+    get_codeowners_parser,
     get_file_owners,
     is_critical_file,
     load_codeowners,
@@ -22,6 +23,7 @@ from src.rules.utils.validation import (
 )
 
 __all__ = [
+    "get_codeowners_parser",
     "get_file_owners",
     "is_critical_file",
     "load_codeowners",
@@ -7,6 +7,7 @@ requirements and determine critical file patterns.
 
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -92,14 +93,28 @@ class CodeOwnersParser:
         if pattern == "*":
             return True
 
-        # Convert pattern to regex
+        regex = CodeOwnersParser._compile_pattern(pattern)
+        return bool(regex and regex.match(file_path))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _compile_pattern(pattern: str) -> re.Pattern[str] | None:
+        """
+        Compile a CODEOWNERS pattern once; every changed file is matched against every pattern.
+
+        Args:
+            pattern: CODEOWNERS pattern
+
+        Returns:
+            Compiled regex, or None if the pattern cannot be compiled
+        """
         regex_pattern = CodeOwnersParser._pattern_to_regex(pattern)
 
         try:
-            return bool(re.match(regex_pattern, file_path))
+            return re.compile(regex_pattern)
         except re.error:
             logger.error(f"Invalid regex pattern: {regex_pattern}")
-            return False
+            return None
 
     @staticmethod
     def _pattern_to_regex(pattern: str) -> str:
@@ -172,8 +187,24 @@ def path_has_owner(file_path: str, codeowners_content: str) -> bool:
     Returns:
         True if the path matches at least one pattern and has owners
     """
-    parser = CodeOwnersParser(codeowners_content)
-    return parser.has_owners(file_path)
+    return get_codeowners_parser(codeowners_content).has_owners(file_path)
+
+
+@lru_cache(maxsize=32)
+def get_codeowners_parser(codeowners_content: str) -> CodeOwnersParser:
+    """
+    Return a parser for CODEOWNERS content, reusing it for identical content.
+
+    Conditions check every changed path of every PR against the same CODEOWNERS file, so the
+    content is parsed once instead of once per path. Callers must not mutate the parser.
+
+    Args:
+        codeowners_content: Raw content of the CODEOWNERS file
+
+    Returns:
+        CodeOwnersParser instance
+    """
+    return CodeOwnersParser(codeowners_content)
 
 
 def load_codeowners(repo_path: str = ".") -> CodeOwnersParser | None:
@@ -6,22 +6,63 @@ This service provides direct analysis of PRs and repositories using:
 - User-provided GitHub PAT (for private repos and higher rate limits)
 """
 
+import asyncio
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
+import aiohttp
+import orjson
 import structlog
 import yaml
+from cachetools import TTLCache  # type: ignore[import-untyped]
+from pydantic import TypeAdapter
 
 from src.agents import get_agent
-from src.core.models import Violation
+from src.core.models import EventType, Violation
+from src.core.utils.concurrency import bounded_as_completed
 from src.integrations.github import GitHubClient
 from src.rules.loaders.github_loader import GitHubRuleLoader
 from src.rules.models import Rule
 from src.utils.github_url import GitHubRepoInfo
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = structlog.get_logger()
 
+# Serializes a whole violation list in one call instead of a model_dump() per item
+_VIOLATIONS_ADAPTER = TypeAdapter(list[Violation])
+
+
+@lru_cache(maxsize=32)
+def _parse_rules_cached(yaml_content: str) -> tuple[Rule, ...]:
+    """Parse rules YAML once per distinct content; the same file is parsed on every analysis."""
+    try:
+        rules_data = yaml.load(yaml_content, Loader=SafeLoader)
+        if not isinstance(rules_data, dict) or "rules" not in rules_data:
+            return ()
+
+        rules = []
+        for rule_data in rules_data["rules"]:
+            if not isinstance(rule_data, dict):
+                continue
+            try:
+                rule = GitHubRuleLoader._parse_rule(rule_data)
+                if rule:
+                    rules.append(rule)
+            except Exception as e:
+                logger.warning(f"Error parsing rule: {e}")
+                continue
+
+        return tuple(rules)
+    except Exception as e:
+        logger.error(f"Error parsing YAML: {e}")
+        return ()
+
 
 class AnalysisResult:
     """Result of a standalone analysis."""
@@ -36,6 +77,7 @@ class AnalysisResult:
         repo_info: GitHubRepoInfo | None = None,
         pr_data: dict[str, Any] | None = None,
         prs_analyzed: list[dict[str, Any]] | None = None,
+        violations_dumps: list[dict[str, Any]] | None = None,
     ):
         self.success = success
         self.violations = violations
@@ -45,32 +87,52 @@ class AnalysisResult:
         self.repo_info = repo_info
         self.pr_data = pr_data
         self.prs_analyzed = prs_analyzed or []
+        # Already-serialized violations (batch mode dumps each PR's violations once for its summary)
+        self._violations_dumps = violations_dumps
+
+    def violations_data(self) -> list[dict[str, Any]]:
+        """Serialize violations for API responses."""
+        if self._violations_dumps is not None:
+            return self._violations_dumps
+        return cast("list[dict[str, Any]]", _VIOLATIONS_ADAPTER.dump_python(self.violations))
+
+    def repository_summary(self) -> dict[str, Any] | None:
+        """Repository information for API responses."""
+        if not self.repo_info:
+            return None
+        return {
+            "owner": self.repo_info.owner,
+            "repo": self.repo_info.repo,
+            "full_name": self.repo_info.full_name,
+            "url": self.repo_info.url,
+            "pr_number": self.repo_info.pr_number,
+        }
+
+    def pr_summary(self) -> dict[str, Any] | None:
+        """Metadata of the first analyzed PR for API responses."""
+        if not self.pr_data:
+            return None
+        return {
+            "number": self.pr_data.get("number"),
+            "title": self.pr_data.get("title"),
+            "state": self.pr_data.get("state"),
+            "user": (self.pr_data.get("user") or {}).get("login"),
+            "created_at": self.pr_data.get("created_at"),
+            "head_branch": (self.pr_data.get("head") or {}).get("ref"),
+            "base_branch": (self.pr_data.get("base") or {}).get("ref"),
+        }
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API response."""
         return {
             "success": self.success,
-            "violations": [v.model_dump() for v in self.violations],
+            "violations": self.violations_data(),
             "violations_count": len(self.violations),
             "rules_loaded": self.rules_loaded,
             "processing_time_ms": self.processing_time_ms,
             "error": self.error,
-            "repository": {
-                "owner": self.repo_info.owner if self.repo_info else None,
-                "repo": self.repo_info.repo if self.repo_info else None,
-                "full_name": self.repo_info.full_name if self.repo_info else None,
-                "url": self.repo_info.url if self.repo_info else None,
-                "pr_number": self.repo_info.pr_number if self.repo_info else None,
-            } if self.repo_info else None,
-            "pr_data": {
-                "number": self.pr_data.get("number"),
-                "title": self.pr_data.get("title"),
-                "state": self.pr_data.get("state"),
-                "user": self.pr_data.get("user", {}).get("login"),
-                "created_at": self.pr_data.get("created_at"),
-                "head_branch": self.pr_data.get("head", {}).get("ref"),
-                "base_branch": self.pr_data.get("base", {}).get("ref"),
-            } if self.pr_data else None,
+            "repository": self.repository_summary(),
+            "pr_data": self.pr_summary(),
             "prs_analyzed": self.prs_analyzed,
         }
 
@@ -87,17 +149,26 @@ class StandaloneAnalyzer:
     """
 
     LOCAL_RULES_PATH = Path(__file__).parent.parent.parent / ".watchflow" / "rules.yaml"
+    CODEOWNERS_PATHS = (".github/CODEOWNERS", "CODEOWNERS", "docs/CODEOWNERS")
 
-    def __init__(self):
+    def __init__(self, max_concurrent_prs: int = 10):
         self.github_client = GitHubClient()
         self.engine_agent = get_agent("engine")
+        # Upper bound on PRs analyzed at once in batch mode, to stay polite with the GitHub API
+        self.max_concurrent_prs = max_concurrent_prs
+        # Repository files rarely change between analyses; keyed by (repo, token) so content
+        # fetched with one user's token is never served to another caller. TTL: 5 minutes.
+        self._codeowners_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+        self._rules_content_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+        # (path, mtime_ns, rules) of the last local fallback read, so the file is re-read only after it changes
+        self._local_rules: tuple[Path, int, tuple[Rule, ...]] | None = None
 
     async def analyze(
         self,
         repo_info: GitHubRepoInfo,
         pr_number: int | None = None,
         rules_yaml: str | None = None,
-        github_token: str | None = None,
+        github_token: str | list[str] | None = None,
         max_prs: int = 5,
         batch_mode: bool = False,
     ) -> AnalysisResult:
@@ -108,7 +179,8 @@ class StandaloneAnalyzer:
             repo_info: Parsed GitHub repository information
             pr_number: Optional PR number to analyze (if None, analyzes latest open PRs)
             rules_yaml: Optional YAML string with custom rules
-            github_token: Optional GitHub PAT for private repos / higher rate limits
+            github_token: Optional GitHub PAT for private repos / higher rate limits. Several tokens
+                may be given; each analysis uses the one with the most remaining rate limit.
             max_prs: Maximum number of PRs to analyze when no specific PR is given
             batch_mode: Enable batch mode for analyzing large numbers of PRs (up to 200)
 
@@ -120,6 +192,9 @@ class StandaloneAnalyzer:
         if pr_number is None:
             pr_number = repo_info.pr_number
 
+        if isinstance(github_token, list):
+            github_token = self.github_client.pick_token(github_token) if github_token else None
+
         try:
             repo_data = await self.github_client.get_repository(
                 repo_info.full_name,
@@ -154,13 +229,35 @@ class StandaloneAnalyzer:
                     repo_info=repo_info,
                 )
 
+            # The engine discards rules for other event types on every call; do it once per analysis
+            pr_rules = self._pull_request_rules(rules)
+
+            # Resolve auth headers and the HTTP session once and share them across all PR fetches
+            headers = await self.github_client._get_auth_headers(user_token=github_token, allow_anonymous=True)
+            session = await self.github_client._get_session()
+
             if pr_number:
                 return await self._analyze_single_pr(
-                    repo_info, pr_number, rules, rules_loaded, github_token, start_time
+                    repo_info,
+                    pr_number,
+                    pr_rules,
+                    rules_loaded,
+                    github_token,
+                    start_time,
+                    headers=headers,
+                    session=session,
                 )
             else:
                 return await self._analyze_latest_prs(
-                    repo_info, rules, rules_loaded, github_token, max_prs, start_time, batch_mode
+                    repo_info,
+                    pr_rules,
+                    rules_loaded,
+                    github_token,
+                    max_prs,
+                    start_time,
+                    batch_mode,
+                    headers=headers,
+                    session=session,
                 )
 
         except Exception as e:
@@ -182,9 +279,13 @@ class StandaloneAnalyzer:
         rules_loaded: int,
         github_token: str | None,
         start_time: float,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> AnalysisResult:
         """Analyze a single PR."""
-        pr_data = await self._fetch_pr_data(repo_info.full_name, pr_number, github_token)
+        pr_data = await self._fetch_pr_data(
+            repo_info.full_name, pr_number, github_token, headers=headers, session=session
+        )
         if not pr_data:
             return AnalysisResult(
                 success=False,
@@ -195,7 +296,10 @@ class StandaloneAnalyzer:
                 repo_info=repo_info,
             )
 
-        event_data = await self._build_event_data(repo_info.full_name, pr_data, github_token)
+        codeowners_content = await self._fetch_codeowners(repo_info.full_name, github_token)
+        event_data = await self._build_event_data(
+            repo_info.full_name, pr_data, github_token, codeowners_content, headers=headers, session=session
+        )
         violations = await self._evaluate_rules(rules, event_data)
 
         return AnalysisResult(
@@ -221,6 +325,8 @@ class StandaloneAnalyzer:
         max_prs: int,
         start_time: float,
         batch_mode: bool = False,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> AnalysisResult:
         """Analyze the latest open PRs in the repository."""
         # Use pagination for any request > 20, otherwise use simple fetch
@@ -239,9 +345,6 @@ class StandaloneAnalyzer:
                 repo_info=repo_info,
             )
 
-        all_violations: list[Violation] = []
-        prs_analyzed: list[dict[str, Any]] = []
-        
         logger.info(
             "batch_analysis_started",
             repo=repo_info.full_name,
@@ -249,38 +352,58 @@ class StandaloneAnalyzer:
             batch_mode=batch_mode,
         )
 
-        for i, pr in enumerate(prs):
-            pr_number = pr.get("number")
-            pr_title = pr.get("title", "")
-            
-            try:
-                event_data = await self._build_event_data(repo_info.full_name, pr, github_token)
-                violations = await self._evaluate_rules(rules, event_data)
-                
-                all_violations.extend(violations)
-                prs_analyzed.append({
-                    "number": pr_number,
-                    "title": pr_title,
-                    "violations_count": len(violations),
-                    "violations": [v.model_dump() for v in violations],
-                })
-                
-                if (i + 1) % 10 == 0:
-                    logger.info(
-                        "batch_analysis_progress",
-                        repo=repo_info.full_name,
-                        processed=i + 1,
-                        total=len(prs),
-                    )
-            except Exception as e:
-                logger.error("pr_analysis_failed", pr_number=pr_number, error=str(e))
-                prs_analyzed.append({
-                    "number": pr_number,
-                    "title": pr_title,
-                    "violations_count": 0,
-                    "violations": [],
-                    "error": str(e),
-                })
+        # CODEOWNERS is the same for every PR in the batch, so fetch it once up front
+        codeowners_content = await self._fetch_codeowners(repo_info.full_name, github_token)
+
+        # GraphQL needs a token; with one, reviews and files for the whole batch come from a few
+        # aliased queries. PRs missing from the result fall back to per-PR REST calls.
+        bundles: dict[int, dict[str, list[dict[str, Any]]]] = {}
+        if github_token:
+            pr_numbers = [pr["number"] for pr in prs if pr.get("number")]
+            bundles = await self.github_client.fetch_pr_bundles(
+                repo_info.full_name, pr_numbers, user_token=github_token
+            )
+
+        # PR analysis is I/O bound, so overlap requests while bounding how many run at once.
+        # Results arrive in completion order; they are slotted back by index to keep input order.
+        analyses = (
+            self._analyze_one_pr(
+                repo_info.full_name,
+                pr,
+                rules,
+                github_token,
+                codeowners_content,
+                bundles.get(pr["number"]) if pr.get("number") else None,
+                headers=headers,
+                session=session,
+            )
+            for pr in prs
+        )
+        results_by_index: dict[int, tuple[dict[str, Any], list[Violation]]] = {}
+        async for index, result in bounded_as_completed(analyses, self.max_concurrent_prs):
+            results_by_index[index] = result
+            logger.info(
+                "batch_analysis_progress",
+                repo=repo_info.full_name,
+                processed=len(results_by_index),
+                total=len(prs),
+            )
+        results = [results_by_index[index] for index in range(len(prs))]
+
+        all_violations: list[Violation] = []
+        violations_dumps: list[dict[str, Any]] = []
+        prs_analyzed: list[dict[str, Any]] = []
+        for summary, violations in results:
+            all_violations.extend(violations)
+            violations_dumps.extend(summary["violations"])
+            prs_analyzed.append(summary)
+
+        logger.info(
+            "batch_analysis_completed",
+            repo=repo_info.full_name,
+            processed=len(results),
+            total=len(prs),
+        )
 
         return AnalysisResult(
             success=True,
@@ -290,8 +413,46 @@ class StandaloneAnalyzer:
             repo_info=repo_info,
             pr_data=prs[0] if prs else None,
             prs_analyzed=prs_analyzed,
+            violations_dumps=violations_dumps,
         )
 
+    async def _analyze_one_pr(
+        self,
+        repo_full_name: str,
+        pr: dict[str, Any],
+        rules: list[Rule],
+        github_token: str | None,
+        codeowners_content: str | None,
+        bundle: dict[str, list[dict[str, Any]]] | None = None,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ) -> tuple[dict[str, Any], list[Violation]]:
+        """Analyze one PR of a batch, returning its summary entry and violations."""
+        pr_number = pr.get("number")
+        pr_title = pr.get("title", "")
+
+        try:
+            event_data = await self._build_event_data(
+                repo_full_name, pr, github_token, codeowners_content, bundle, headers=headers, session=session
+            )
+            violations = await self._evaluate_rules(rules, event_data)
+        except Exception as e:
+            logger.error("pr_analysis_failed", pr_number=pr_number, error=str(e))
+            return {
+                "number": pr_number,
+                "title": pr_title,
+                "violations_count": 0,
+                "violations": [],
+                "error": str(e),
+            }, []
+
+        return {
+            "number": pr_number,
+            "title": pr_title,
+            "violations_count": len(violations),
+            "violations": _VIOLATIONS_ADAPTER.dump_python(violations),
+        }, violations
+
     async def _fetch_open_prs(
         self, repo_full_name: str, github_token: str | None, limit: int = 5
     ) -> list[dict[str, Any]]:
@@ -328,14 +489,20 @@ class StandaloneAnalyzer:
             return []
 
     async def _fetch_pr_data(
-        self, repo_full_name: str, pr_number: int, github_token: str | None
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        github_token: str | None,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> dict[str, Any] | None:
         """Fetch PR data from GitHub API."""
         try:
-            headers = await self.github_client._get_auth_headers(
-                user_token=github_token,
-                allow_anonymous=True,
-            )
+            if headers is None:
+                headers = await self.github_client._get_auth_headers(
+                    user_token=github_token,
+                    allow_anonymous=True,
+                )
             if not headers:
                 return None
 
@@ -343,12 +510,11 @@ class StandaloneAnalyzer:
 
             url = f"{config.github.api_base_url}/repos/{repo_full_name}/pulls/{pr_number}"
 
-            # Use the already-configured session (with SSL disabled)
-            session = await self.github_client._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                return None
+            # Revalidated with If-None-Match, so unchanged data costs no rate limit
+            status, body = await self.github_client._conditional_get(url, headers, session=session)
+            if status == 200 and body is not None:
+                return cast("dict[str, Any]", orjson.loads(body))
+            return None
         except Exception as e:
             logger.error(f"Error fetching PR data: {e}")
             return None
@@ -362,57 +528,72 @@ class StandaloneAnalyzer:
             return self._parse_rules_from_yaml(rules_yaml)
 
         try:
-            from src.core.config import config
-
-            rules_file_path = f"{config.repo_config.base_path}/{config.repo_config.rules_file}"
-            content = await self.github_client.get_file_content(
-                repo_full_name,
-                rules_file_path,
-                installation_id=None,
-                user_token=github_token,
-            )
+            content = await self._fetch_rules_content(repo_full_name, github_token)
             if content:
-                logger.info(f"Loaded rules from repository: {rules_file_path}")
+                logger.info(f"Loaded rules from repository: {repo_full_name}")
                 return self._parse_rules_from_yaml(content)
         except Exception as e:
             logger.warning(f"Could not fetch rules from repository: {e}")
 
         if self.LOCAL_RULES_PATH.exists():
             logger.info(f"Using local fallback rules: {self.LOCAL_RULES_PATH}")
-            content = self.LOCAL_RULES_PATH.read_text()
-            return self._parse_rules_from_yaml(content)
+            return list(await self._read_local_rules(self.LOCAL_RULES_PATH))
 
         logger.warning("No rules found anywhere")
         return []
 
+    async def _read_local_rules(self, path: Path) -> tuple[Rule, ...]:
+        """Read the local rules file off the event loop, reusing the last parse while its mtime is unchanged."""
+        mtime_ns = path.stat().st_mtime_ns
+        if self._local_rules is not None and self._local_rules[:2] == (path, mtime_ns):
+            return self._local_rules[2]
+
+        content = await asyncio.to_thread(path.read_text)
+        rules = _parse_rules_cached(content)
+        self._local_rules = (path, mtime_ns, rules)
+        return rules
+
+    async def _fetch_rules_content(self, repo_full_name: str, github_token: str | None) -> str | None:
+        """Fetch the repository's rules file, cached per repository and token."""
+        cache_key = (repo_full_name, github_token)
+        if cache_key in self._rules_content_cache:
+            return cast("str | None", self._rules_content_cache[cache_key])
+
+        from src.core.config import config
+
+        rules_file_path = f"{config.repo_config.base_path}/{config.repo_config.rules_file}"
+        content = await self.github_client.get_file_content(
+            repo_full_name,
+            rules_file_path,
+            installation_id=None,
+            user_token=github_token,
+        )
+        self._rules_content_cache[cache_key] = content
+        return content
+
     def _parse_rules_from_yaml(self, yaml_content: str) -> list[Rule]:
         """Parse rules from YAML content using the existing loader logic."""
-        try:
-            rules_data = yaml.safe_load(yaml_content)
-            if not isinstance(rules_data, dict) or "rules" not in rules_data:
-                return []
-
-            rules = []
-            for rule_data in rules_data["rules"]:
-                if not isinstance(rule_data, dict):
-                    continue
-                try:
-                    rule = GitHubRuleLoader._parse_rule(rule_data)
-                    if rule:
-                        rules.append(rule)
-                except Exception as e:
-                    logger.warning(f"Error parsing rule: {e}")
-                    continue
-
-            return rules
-        except Exception as e:
-            logger.error(f"Error parsing YAML: {e}")
+        # Empty or rule-less content (e.g. a blank rules file) can't yield rules; skip the YAML parse
+        if not yaml_content or "rules" not in yaml_content:
             return []
+        return list(_parse_rules_cached(yaml_content))
+
+    @staticmethod
+    def _pull_request_rules(rules: list[Rule]) -> list[Rule]:
+        """Keep only the rules the engine would evaluate for a pull_request event."""
+        return [rule for rule in rules if EventType.PULL_REQUEST in rule.event_types]
 
     async def _build_event_data(
-        self, repo_full_name: str, pr_data: dict[str, Any], github_token: str | None
+        self,
+        repo_full_name: str,
+        pr_data: dict[str, Any],
+        github_token: str | None,
+        codeowners_content: str | None = None,
+        bundle: dict[str, list[dict[str, Any]]] | None = None,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> dict[str, Any]:
-        """Build event data structure for rule evaluation."""
+        """Build event data structure for rule evaluation, using prefetched reviews/files when given."""
         event_data = {
             "pull_request_details": pr_data,
             "triggering_user": {"login": (pr_data.get("user") or {}).get("login")},
@@ -426,10 +607,17 @@ class StandaloneAnalyzer:
 
         pr_number = pr_data.get("number")
         if pr_number:
-            reviews = await self._fetch_pr_reviews(repo_full_name, pr_number, github_token)
-            event_data["reviews"] = reviews or []
+            if bundle is not None:
+                reviews, files = bundle["reviews"], bundle["files"]
+            else:
+                reviews = await self._fetch_pr_reviews(
+                    repo_full_name, pr_number, github_token, headers=headers, session=session
+                )
+                files = await self._fetch_pr_files(
+                    repo_full_name, pr_number, github_token, headers=headers, session=session
+                )
 
-            files = await self._fetch_pr_files(repo_full_name, pr_number, github_token)
+            event_data["reviews"] = reviews or []
             event_data["files"] = files or []
             event_data["changed_files"] = [
                 {
@@ -441,21 +629,26 @@ class StandaloneAnalyzer:
                 for f in (files or [])
             ]
 
-            codeowners_content = await self._fetch_codeowners(repo_full_name, github_token)
             if codeowners_content:
                 event_data["codeowners_content"] = codeowners_content
 
         return event_data
 
     async def _fetch_pr_reviews(
-        self, repo_full_name: str, pr_number: int, github_token: str | None
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        github_token: str | None,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> list[dict[str, Any]]:
         """Fetch PR reviews."""
         try:
-            headers = await self.github_client._get_auth_headers(
-                user_token=github_token,
-                allow_anonymous=True,
-            )
+            if headers is None:
+                headers = await self.github_client._get_auth_headers(
+                    user_token=github_token,
+                    allow_anonymous=True,
+                )
             if not headers:
                 return []
 
@@ -463,25 +656,30 @@ class StandaloneAnalyzer:
 
             url = f"{config.github.api_base_url}/repos/{repo_full_name}/pulls/{pr_number}/reviews"
 
-            # Use the already-configured session (with SSL disabled)
-            session = await self.github_client._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                return []
+            # Revalidated with If-None-Match, so unchanged data costs no rate limit
+            status, body = await self.github_client._conditional_get(url, headers, session=session)
+            if status == 200 and body is not None:
+                return cast("list[dict[str, Any]]", orjson.loads(body))
+            return []
         except Exception as e:
             logger.error(f"Error fetching reviews: {e}")
             return []
 
     async def _fetch_pr_files(
-        self, repo_full_name: str, pr_number: int, github_token: str | None
+        self,
+        repo_full_name: str,
+        pr_number: int,
+        github_token: str | None,
+        headers: dict[str, str] | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> list[dict[str, Any]]:
         """Fetch PR files."""
         try:
-            headers = await self.github_client._get_auth_headers(
-                user_token=github_token,
-                allow_anonymous=True,
-            )
+            if headers is None:
+                headers = await self.github_client._get_auth_headers(
+                    user_token=github_token,
+                    allow_anonymous=True,
+                )
             if not headers:
                 return []
 
@@ -489,12 +687,11 @@ class StandaloneAnalyzer:
 
             url = f"{config.github.api_base_url}/repos/{repo_full_name}/pulls/{pr_number}/files"
 
-            # Use the already-configured session (with SSL disabled)
-            session = await self.github_client._get_session()
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                return []
+            # Revalidated with If-None-Match, so unchanged data costs no rate limit
+            status, body = await self.github_client._conditional_get(url, headers, session=session)
+            if status == 200 and body is not None:
+                return cast("list[dict[str, Any]]", orjson.loads(body))
+            return []
         except Exception as e:
             logger.error(f"Error fetching files: {e}")
             return []
@@ -502,9 +699,14 @@ class StandaloneAnalyzer:
     async def _fetch_codeowners(
         self, repo_full_name: str, github_token: str | None
     ) -> str | None:
-        """Fetch CODEOWNERS content."""
-        codeowners_paths = [".github/CODEOWNERS", "CODEOWNERS", "docs/CODEOWNERS"]
-        for path in codeowners_paths:
+        """Fetch CODEOWNERS content, cached per repository and token."""
+        cache_key = (repo_full_name, github_token)
+        if cache_key in self._codeowners_cache:
+            return cast("str | None", self._codeowners_cache[cache_key])
+
+        content = None
+        probe_failed = False
+        for path in self.CODEOWNERS_PATHS:
             try:
                 content = await self.github_client.get_file_content(
                     repo_full_name,
@@ -513,17 +715,26 @@ class StandaloneAnalyzer:
                     user_token=github_token,
                 )
                 if content:
-                    return content
+                    break
             except Exception:
+                probe_failed = True
                 continue
-        return None
+
+        # Only cache real outcomes: content found, or every path missing. A transient error on
+        # one path shouldn't disable CODEOWNERS-based rules until the entry expires.
+        if content or not probe_failed:
+            self._codeowners_cache[cache_key] = content
+        return content
 
     async def _evaluate_rules(
         self, rules: list[Rule], event_data: dict[str, Any]
     ) -> list[Violation]:
         """Run rule evaluation and return violations."""
+        if not rules:
+            return []
+
         try:
-            pr_number = event_data.get("pull_request_details", {}).get("number")
+            pr_number = (event_data.get("pull_request_details") or {}).get("number")
 
             result = await self.engine_agent.execute(
                 event_type="pull_request",
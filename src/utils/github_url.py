@@ -6,11 +6,12 @@ Extracts owner, repo, and optional PR/branch information from various GitHub URL
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(frozen=True)
 class GitHubRepoInfo:
-    """Parsed GitHub repository information."""
+    """Parsed GitHub repository information (immutable so parsed results can be shared)."""
 
     owner: str
     repo: str
@@ -42,48 +43,42 @@ class GitHubURLParser:
     - owner/repo
     """
 
-    HTTPS_PATTERN = re.compile(
-        r"https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:/)?"
+    # All formats in one alternation, so a single match() call parses any input. Python's re
+    # does not allow repeated group names, hence the ssh_/short_ prefixes on the other branches.
+    URL_PATTERN = re.compile(
+        r"^(?:"
+        # https://github.com/..., http://github.com/... and bare github.com/...
+        r"(?:https?://)?github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:/)?"
         r"(?:(?:tree|blob)/(?P<branch>[^/]+))?"
         r"(?:pull/(?P<pr>\d+))?"
         r"(?:\.git)?"
-        r"(?:/)?$"
+        r"(?:/)?"
+        # git@github.com:owner/repo.git
+        r"|git@github\.com:(?P<ssh_owner>[^/]+)/(?P<ssh_repo>[^/]+?)(?:\.git)?/?"
+        # owner/repo
+        r"|(?P<short_owner>[a-zA-Z0-9_-]+)/(?P<short_repo>[a-zA-Z0-9_.-]+)"
+        r")$"
     )
 
-    BARE_PATTERN = re.compile(
-        r"^github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:/)?"
-        r"(?:(?:tree|blob)/(?P<branch>[^/]+))?"
-        r"(?:pull/(?P<pr>\d+))?"
-        r"(?:\.git)?"
-        r"(?:/)?$"
-    )
-
-    SSH_PATTERN = re.compile(r"git@github\.com:(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$")
-
-    SHORT_PATTERN = re.compile(r"^(?P<owner>[a-zA-Z0-9_-]+)/(?P<repo>[a-zA-Z0-9_.-]+)$")
-
     @classmethod
+    @lru_cache(maxsize=4096)  # noqa: B019 - bounded, and the class is never collected anyway
     def parse(cls, url: str) -> GitHubRepoInfo | None:
         """
         Parse a GitHub URL and return repository information.
 
+        Results are memoized: clients resubmit the same URLs and GitHubRepoInfo is immutable.
+
         Args:
             url: GitHub URL or 'owner/repo' string
 
         Returns:
             GitHubRepoInfo if valid, None if parsing fails
         """
-        url = url.strip()
-
-        if match := cls.HTTPS_PATTERN.match(url):
-            return GitHubRepoInfo(
-                owner=match.group("owner"),
-                repo=match.group("repo"),
-                branch=match.group("branch"),
-                pr_number=int(match.group("pr")) if match.group("pr") else None,
-            )
+        match = cls.URL_PATTERN.match(url.strip())
+        if not match:
+            return None
 
-        if match := cls.BARE_PATTERN.match(url):
+        if match.group("owner"):
             return GitHubRepoInfo(
                 owner=match.group("owner"),
                 repo=match.group("repo"),
@@ -91,19 +86,10 @@ class GitHubURLParser:
                 pr_number=int(match.group("pr")) if match.group("pr") else None,
             )
 
-        if match := cls.SSH_PATTERN.match(url):
-            return GitHubRepoInfo(
-                owner=match.group("owner"),
-                repo=match.group("repo"),
-            )
-
-        if match := cls.SHORT_PATTERN.match(url):
-            return GitHubRepoInfo(
-                owner=match.group("owner"),
-                repo=match.group("repo"),
-            )
+        if match.group("ssh_owner"):
+            return GitHubRepoInfo(owner=match.group("ssh_owner"), repo=match.group("ssh_repo"))
 
-        return None
+        return GitHubRepoInfo(owner=match.group("short_owner"), repo=match.group("short_repo"))
 
     @classmethod
     def is_valid_github_url(cls, url: str) -> bool:
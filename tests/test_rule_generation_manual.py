@@ -1,37 +1,31 @@
-import requests
-import json
+import asyncio
 import os
+
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Test configuration - using 127.0.0.1 instead of localhost
-API_URL = "http://127.0.1:8000/api/v1/rules/recommend"
-REPO_URL = "https://github.com/IceT5/servlet"
+API_URL = "http://127.0.0.1:8000/api/v1/rules/recommend"
+# Add more repositories here; they are requested concurrently
+REPO_URLS = ["https://github.com/IceT5/servlet"]
 GitHub_Token = os.getenv("GITHUB_TOKEN")
 
-# Test payload
-payload = {
-    "repo_url": REPO_URL,
-    "github_token": GitHub_Token,
-    "force_refresh": False
-}
-
-print("=" * 60)
-print("Testing Automatic Rule Generation")
-print("=" * 60)
-print(f"Repository: {REPO_URL}")
-print(f"API Endpoint: {API_URL}")
-print(f"Using GitHub Token: {GitHub_Token[:10]}...") 
-print()
-
-try:
-    print("Sending request ...")
-    # No timeout - wait as long as needed for analysis to complete
-    response = requests.post(API_URL, json=payload)
 
-    print(f"\nStatus Code: {response.status_code}")
+def build_payload(repo_url: str) -> dict:
+    return {
+        "repo_url": repo_url,
+        "github_token": GitHub_Token,
+        "force_refresh": False
+    }
+
+
+def print_result(repo_url: str, response: httpx.Response) -> None:
+    print("\n" + "=" * 60)
+    print(f"Repository: {repo_url}")
+    print(f"Status Code: {response.status_code}")
 
     if response.status_code == 200:
         print("[OK] Request successful.")
@@ -42,7 +36,8 @@ try:
         print("=" * 60)
 
         # Print key information
-        print(f"\n[OK] Rules generated: {len(result.get('rules_yaml', '').split('description')) - 1 if 'description:' in result.get('rules_yaml', '') else 0}")
+        rules_count = result.get('rules_yaml', '').count('description:')
+        print(f"\n[OK] Rules generated: {rules_count}")
 
         # Print rules YAML
         print("\n" + "-" * 60)
@@ -66,7 +61,7 @@ try:
             print("-" * 60)
             for warning in warnings:
                 print(f"[WARNING] {warning}")
-        
+
         # Print analysis report
         print("\n" + "-" * 60)
         print("ANALYSIS REPORT")
@@ -81,10 +76,37 @@ try:
         print(f"[ERROR] Request failed with status code {response.status_code}")
         print(f"Error Response: {response.text}")
 
-except requests.exceptions.RequestException as e:
-    print(f"\n[ERROR] Request failed: {str(e)}")
 
-except Exception as e:
-    print(f"\n[ERROR] Unexpected error: {str(e)}")
-    import traceback
-    traceback.print_exc()
+async def main() -> None:
+    print("=" * 60)
+    print("Testing Automatic Rule Generation")
+    print("=" * 60)
+    print(f"Repositories: {', '.join(REPO_URLS)}")
+    print(f"API Endpoint: {API_URL}")
+    print(f"Using GitHub Token: {GitHub_Token[:10]}...")
+    print()
+
+    print("Sending requests ...")
+    # No timeout - wait as long as needed for analysis to complete
+    async with httpx.AsyncClient(timeout=None) as client:
+        responses = await asyncio.gather(
+            *(client.post(API_URL, json=build_payload(repo_url)) for repo_url in REPO_URLS),
+            return_exceptions=True,
+        )
+
+    for repo_url, response in zip(REPO_URLS, responses, strict=True):
+        if isinstance(response, httpx.HTTPError):
+            print(f"\n[ERROR] Request for {repo_url} failed: {str(response)}")
+        elif isinstance(response, BaseException):
+            print(f"\n[ERROR] Unexpected error for {repo_url}: {str(response)}")
+        else:
+            try:
+                print_result(repo_url, response)
+            except Exception as e:
+                print(f"\n[ERROR] Unexpected error: {str(e)}")
+                import traceback
+                traceback.print_exc()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
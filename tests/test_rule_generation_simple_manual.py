@@ -1,39 +1,31 @@
-import requests
-import json
-import time
-import sys
-import io
+import asyncio
 import os
+
+import httpx
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 # Test configuration - using 127.0.0.1 instead of localhost
-API_URL = "http://127.0.1:8000/api/v1/rules/recommend-test"
-REPO_URL = "https://github.com/IceT5/servlet"
+API_URL = "http://127.0.0.1:8000/api/v1/rules/recommend-test"
+# Add more repositories here; they are requested concurrently
+REPO_URLS = ["https://github.com/IceT5/servlet"]
 GitHub_Token = os.getenv("GITHUB_TOKEN")
 
-# Test payload
-payload = {
-    "repo_url": REPO_URL,
-    "github_token": GitHub_Token,
-    "force_refresh": False
-}
 
-print("=" * 60)
-print("Testing Automatic Rule Generation (Mock Endpoint)")
-print("=" * 60)
-print(f"Repository: {REPO_URL}")
-print(f"API Endpoint: {API_URL}")
-print(f"Using GitHub Token: {GitHub_Token[:10]}...")
-print()
+def build_payload(repo_url: str) -> dict:
+    return {
+        "repo_url": repo_url,
+        "github_token": GitHub_Token,
+        "force_refresh": False
+    }
 
-try:
-    print("Sending request ...")
-    response = requests.post(API_URL, json=payload, timeout=30)
 
-    print(f"\nStatus Code: {response.status_code}")
+def print_result(repo_url: str, response: httpx.Response) -> None:
+    print("\n" + "=" * 60)
+    print(f"Repository: {repo_url}")
+    print(f"Status Code: {response.status_code}")
 
     if response.status_code == 200:
         print("[OK] Request successful.")
@@ -75,14 +67,39 @@ try:
     else:
         print(f"Request failed with status {response.status_code}")
         print(f"Error Response: {response.text}")
-    
-except requests.exceptions.Timeout:
-    print("\n Request timed out after 30 seconds")
 
-except requests.exceptions.RequestException as e:
-    print(f"\n Request failed: {str(e)}")
 
-except Exception as e:
-    print(f"\n Unexpected error: {str(e)}")
-    import traceback
-    traceback.print_exc()
\ No newline at end of file
+async def main() -> None:
+    print("=" * 60)
+    print("Testing Automatic Rule Generation (Mock Endpoint)")
+    print("=" * 60)
+    print(f"Repositories: {', '.join(REPO_URLS)}")
+    print(f"API Endpoint: {API_URL}")
+    print(f"Using GitHub Token: {GitHub_Token[:10]}...")
+    print()
+
+    print("Sending requests ...")
+    async with httpx.AsyncClient(timeout=30) as client:
+        responses = await asyncio.gather(
+            *(client.post(API_URL, json=build_payload(repo_url)) for repo_url in REPO_URLS),
+            return_exceptions=True,
+        )
+
+    for repo_url, response in zip(REPO_URLS, responses, strict=True):
+        if isinstance(response, httpx.TimeoutException):
+            print(f"\n Request for {repo_url} timed out after 30 seconds")
+        elif isinstance(response, httpx.HTTPError):
+            print(f"\n Request for {repo_url} failed: {str(response)}")
+        elif isinstance(response, BaseException):
+            print(f"\n Unexpected error for {repo_url}: {str(response)}")
+        else:
+            try:
+                print_result(repo_url, response)
+            except Exception as e:
+                print(f"\n Unexpected error: {str(e)}")
+                import traceback
+                traceback.print_exc()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
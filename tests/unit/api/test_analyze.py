@@ -0,0 +1,110 @@
+from fastapi.testclient import TestClient
+
+from src.core.models import Severity, Violation
+from src.main import app
+from src.services.standalone_analyzer import AnalysisResult
+from src.utils.github_url import GitHubRepoInfo
+
+
+def test_analyze_returns_serialized_result(monkeypatch):
+    client = TestClient(app)
+
+    async def _fake_analyze(repo_info, **kwargs):
+        return AnalysisResult(
+            success=True,
+            violations=[
+                Violation(rule_description="PRs need a linked issue", severity=Severity.HIGH, message="No issue")
+            ],
+            rules_loaded=3,
+            processing_time_ms=12,
+            repo_info=repo_info,
+            pr_data={"number": 7, "title": "Fix", "user": {"login": "octocat"}, "head": {"ref": "fix"}},
+            prs_analyzed=[{"number": 7, "title": "Fix", "violations_count": 1}],
+        )
+
+    from src.api import analyze as analyze_api
+
+    monkeypatch.setattr(analyze_api.standalone_analyzer, "analyze", _fake_analyze)
+
+    response = client.post("/api/v1/analyze", json={"repository_url": "https://github.com/owner/repo"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["violations_count"] == 1
+    assert data["violations"][0]["rule_description"] == "PRs need a linked issue"
+    assert data["rules_loaded"] == 3
+    assert data["repository"]["full_name"] == "owner/repo"
+    assert data["pr_data"]["user"] == "octocat"
+    assert data["pr_data"]["head_branch"] == "fix"
+    assert data["pr_data"]["base_branch"] is None
+    assert data["prs_analyzed"] == [{"number": 7, "title": "Fix", "violations_count": 1}]
+
+
+def test_analyze_rejects_invalid_url():
+    client = TestClient(app)
+
+    response = client.post("/api/v1/analyze", json={"repository_url": "not a repo url"})
+
+    assert response.status_code == 400
+
+
+def test_parse_url_valid_and_invalid():
+    client = TestClient(app)
+
+    response = client.post("/api/v1/parse-url", json={"repository_url": "https://github.com/owner/repo/pull/42"})
+    assert response.json() == {
+        "valid": True,
+        "owner": "owner",
+        "repo": "repo",
+        "full_name": "owner/repo",
+        "pr_number": 42,
+        "branch": None,
+    }
+
+    response = client.post("/api/v1/parse-url", json={"repository_url": "not a repo url"})
+    assert response.json()["valid"] is False
+    assert response.json()["owner"] is None
+
+
+def test_analysis_result_to_dict_without_repo_or_pr():
+    result = AnalysisResult(success=False, violations=[], rules_loaded=0, processing_time_ms=1, error="boom")
+
+    data = result.to_dict()
+
+    assert data["repository"] is None
+    assert data["pr_data"] is None
+    assert data["error"] == "boom"
+
+
+def test_analysis_result_repository_summary():
+    result = AnalysisResult(
+        success=True,
+        violations=[],
+        rules_loaded=1,
+        processing_time_ms=1,
+        repo_info=GitHubRepoInfo(owner="owner", repo="repo", pr_number=5),
+    )
+
+    assert result.repository_summary() == {
+        "owner": "owner",
+        "repo": "repo",
+        "full_name": "owner/repo",
+        "url": "https://github.com/owner/repo",
+        "pr_number": 5,
+    }
+
+
+def test_analysis_result_pr_summary_tolerates_null_user():
+    result = AnalysisResult(
+        success=True,
+        violations=[],
+        rules_loaded=1,
+        processing_time_ms=1,
+        pr_data={"number": 3, "user": None, "head": None},
+    )
+
+    summary = result.pr_summary()
+
+    assert summary["user"] is None
+    assert summary["head_branch"] is None
@@ -0,0 +1,105 @@
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+TITLE_PATTERN = "^feat|^fix|^docs|^style|^refactor|^test|^chore|^perf|^ci|^build|^revert"
+
+# (rule text, validator named in the message, expected rule parameters)
+TRIGGER_PHRASES = [
+    ("PRs must reference an issue", "require_linked_issue", {"require_linked_issue": True}),
+    ("Body should say Fixes #123", "require_linked_issue", {"require_linked_issue": True}),
+    ("Enforce a title pattern", "title_pattern", {"title_pattern": TITLE_PATTERN}),
+    ("Use Conventional Commit titles", "title_pattern", {"title_pattern": TITLE_PATTERN}),
+    ("Critical files need a code owner", "require_code_owner_reviewers", {"require_code_owner_reviewers": True}),
+    ("Merging needs reviewer approval", "require_code_owner_reviewers", {"require_code_owner_reviewers": True}),
+    ("Limit PRs to max lines", "max_pr_loc", {"max_lines": 500}),
+    ("Nothing over 500 lines", "max_pr_loc", {"max_lines": 500}),
+    ("No direct commits allowed", "protected_branches", {"protected_branches": ["main", "master"]}),
+    ("Protect the main branch", "protected_branches", {"protected_branches": ["main", "master"]}),
+]
+
+
+@pytest.mark.parametrize(("rule_text", "validator", "parameters"), TRIGGER_PHRASES)
+def test_evaluate_rule_matches_each_trigger_phrase(rule_text, validator, parameters):
+    client = TestClient(app)
+
+    response = client.post("/api/v1/rules/evaluate", json={"rule_text": rule_text})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["message"] == f"Rule is feasible and can be implemented with {validator} validator"
+    assert data["data"]["supported"] is True
+    assert data["data"]["rule_yaml"] == f"rules:\n{data['data']['snippet']}"
+    # The rule YAML must parse; the title pattern used to be missing its closing quote
+    rules = yaml.safe_load(data["data"]["rule_yaml"])["rules"]
+    assert rules[0]["parameters"] == parameters
+
+
+def test_evaluate_rule_prefers_earlier_pattern_when_several_match():
+    client = TestClient(app)
+
+    # Mentions the issue, title, code owner, lines and main branch patterns; the issue rule wins
+    response = client.post(
+        "/api/v1/rules/evaluate",
+        json={"rule_text": "Code owner review, 500 lines max, conventional commit titles on main branch, Fixes #1"},
+    )
+    assert "require_linked_issue" in response.json()["message"]
+
+    response = client.post("/api/v1/rules/evaluate", json={"rule_text": "Code owner must approve main branch merges"})
+    assert "require_code_owner_reviewers" in response.json()["message"]
+
+
+def test_evaluate_rule_unsupported_fallback():
+    client = TestClient(app)
+
+    response = client.post("/api/v1/rules/evaluate", json={"rule_text": "No deployments on weekends"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "success": False,
+        "message": "This rule pattern is not currently supported by Watchflow validators",
+        "data": {"supported": False, "rule_yaml": "", "snippet": ""},
+        "metadata": {},
+    }
+
+
+def test_evaluate_rule_issue_payload():
+    client = TestClient(app)
+
+    response = client.post("/api/v1/rules/evaluate", json={"rule_text": "PRs must reference an issue"})
+
+    snippet = (
+        '  - description: "PRs must reference an issue number (e.g., Fixes #123)"\n'
+        "    enabled: true\n"
+        '    severity: "medium"\n'
+        '    event_types: ["pull_request"]\n'
+        "    parameters:\n"
+        "      require_linked_issue: true"
+    )
+    assert response.json() == {
+        "success": True,
+        "message": "Rule is feasible and can be implemented with require_linked_issue validator",
+        "data": {"supported": True, "rule_yaml": f"rules:\n{snippet}", "snippet": snippet},
+        "metadata": {},
+    }
+
+
+@pytest.mark.parametrize("rule_text", [phrase for phrase, _, _ in TRIGGER_PHRASES] + ["No deployments on weekends"])
+def test_evaluate_test_falls_back_to_mock_payloads(monkeypatch, rule_text):
+    client = TestClient(app)
+
+    def _no_agent(name):
+        raise RuntimeError("no provider configured")
+
+    from src.api import rules as rules_api
+
+    monkeypatch.setattr(rules_api, "get_agent", _no_agent)
+
+    fallback = client.post("/api/v1/rules/evaluate-test", json={"rule_text": rule_text})
+    mock = client.post("/api/v1/rules/evaluate", json={"rule_text": rule_text})
+
+    assert fallback.status_code == 200
+    assert fallback.json() == mock.json()
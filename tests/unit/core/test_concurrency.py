@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from src.core.utils.concurrency import bounded_as_completed
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_yields_indexed_results_in_completion_order():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def work(value: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (4 - value))
+        in_flight -= 1
+        return value * 10
+
+    results = [item async for item in bounded_as_completed((work(v) for v in range(4)), limit=2)]
+
+    assert sorted(results) == [(0, 0), (1, 10), (2, 20), (3, 30)]
+    assert results[0] == (1, 10)
+    assert max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_propagates_errors():
+    async def boom() -> int:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in bounded_as_completed([boom()], limit=1):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_error_cancels_and_closes_remaining(recwarn):
+    started: list[int] = []
+
+    async def work(value: int) -> int:
+        started.append(value)
+        if value == 1:
+            raise RuntimeError("boom")
+        await asyncio.sleep(1)
+        return value
+
+    coros = [work(v) for v in range(6)]
+
+    with pytest.raises(RuntimeError, match="boom"):
+        async for _ in bounded_as_completed(coros, limit=2):
+            pass
+
+    # Only the first two ever got a slot; the rest were closed without running
+    assert started == [0, 1]
+    await asyncio.sleep(0)  # let the cancelled in-flight task unwind
+    assert all(coro.cr_frame is None for coro in coros)
+    assert not [w for w in recwarn if "never awaited" in str(w.message)]
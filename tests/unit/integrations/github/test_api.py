@@ -28,6 +28,7 @@ def mock_aiohttp_session():
             mock_response = AsyncMock()
             mock_response.status = status
             mock_response.ok = 200 <= status < 300
+            mock_response.headers = {}
 
             # Mock json() awaitable
             async def mock_json():
@@ -222,3 +223,171 @@ async def test_list_pull_requests_success(github_client, mock_aiohttp_session):
     prs = await github_client.list_pull_requests("owner/repo", installation_id=123)
 
     assert prs == [{"number": 1}]
+
+
+@pytest.mark.asyncio
+async def test_fetch_pr_bundles_maps_graphql_to_rest_shapes(github_client, mock_aiohttp_session):
+    mock_aiohttp_session.post.return_value = mock_aiohttp_session.create_mock_response(
+        200,
+        json_data={
+            "data": {
+                "repository": {
+                    "pr1": {
+                        "number": 1,
+                        "reviews": {"nodes": [{"state": "APPROVED", "submittedAt": "t", "author": {"login": "octo"}}]},
+                        "files": {"nodes": [{"path": "a.py", "changeType": "DELETED", "additions": 0, "deletions": 4}]},
+                    },
+                    "pr2": None,
+                }
+            },
+            # A deleted PR errors on its own alias; the rest of the chunk is still used
+            "errors": [{"type": "NOT_FOUND", "path": ["repository", "pr2"]}],
+        },
+    )
+
+    bundles = await github_client.fetch_pr_bundles("owner/repo", [1, 2], user_token="token")
+
+    assert bundles == {
+        1: {
+            "reviews": [{"state": "APPROVED", "submitted_at": "t", "user": {"login": "octo"}}],
+            "files": [{"filename": "a.py", "status": "removed", "additions": 0, "deletions": 4, "changes": 4}],
+        }
+    }
+    mock_aiohttp_session.post.assert_called_once()
+    query = mock_aiohttp_session.post.call_args.kwargs["json"]["query"]
+    assert "pr1: pullRequest(number: 1)" in query
+    assert "pr2: pullRequest(number: 2)" in query
+
+
+@pytest.mark.asyncio
+async def test_fetch_pr_bundles_skips_failed_chunk_without_retrying(github_client, mock_aiohttp_session):
+    ok = mock_aiohttp_session.create_mock_response(
+        200, json_data={"data": {"repository": {"pr3": {"reviews": {"nodes": []}, "files": {"nodes": []}}}}}
+    )
+    mock_aiohttp_session.post.side_effect = [mock_aiohttp_session.create_mock_response(502), ok]
+
+    bundles = await github_client.fetch_pr_bundles("owner/repo", [1, 2, 3], user_token="token", chunk_size=2)
+
+    assert bundles == {3: {"reviews": [], "files": []}}
+    assert mock_aiohttp_session.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_file_content_revalidates_with_etag(github_client, mock_aiohttp_session):
+    fresh = mock_aiohttp_session.create_mock_response(200, text_data="content")
+    fresh.headers = {"ETag": '"abc"'}
+    not_modified = mock_aiohttp_session.create_mock_response(304)
+    mock_aiohttp_session.get.side_effect = [fresh, not_modified]
+
+    first = await github_client.get_file_content("owner/repo", "CODEOWNERS", installation_id=None, user_token="t")
+    second = await github_client.get_file_content("owner/repo", "CODEOWNERS", installation_id=None, user_token="t")
+
+    assert first == second == "content"
+    second_headers = mock_aiohttp_session.get.call_args_list[1].kwargs["headers"]
+    assert second_headers["If-None-Match"] == '"abc"'
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_does_not_share_cache_across_tokens(github_client, mock_aiohttp_session):
+    response = mock_aiohttp_session.create_mock_response(200)
+    response.headers = {"ETag": '"abc"'}
+    response.read = AsyncMock(return_value=b"[]")
+    mock_aiohttp_session.get.return_value = response
+
+    url = "https://api.github.com/repos/owner/repo/pulls/1/files"
+    assert await github_client._conditional_get(url, {"Authorization": "Bearer a"}) == (200, b"[]")
+    await github_client._conditional_get(url, {"Authorization": "Bearer b"})
+
+    other_headers = mock_aiohttp_session.get.call_args_list[1].kwargs["headers"]
+    assert "If-None-Match" not in other_headers
+
+
+@pytest.mark.asyncio
+async def test_etag_cache_is_bounded_by_body_size(github_client, mock_aiohttp_session, monkeypatch):
+    from src.integrations.github import api as github_api
+
+    monkeypatch.setattr(github_api, "_ETAG_MAX_BODY_BYTES", 8)
+    large = mock_aiohttp_session.create_mock_response(200)
+    large.headers = {"ETag": '"big"'}
+    large.read = AsyncMock(return_value=b"x" * 9)
+    small = mock_aiohttp_session.create_mock_response(200)
+    small.headers = {"ETag": '"small"'}
+    small.read = AsyncMock(return_value=b"[]")
+    mock_aiohttp_session.get.side_effect = [large, small]
+
+    await github_client._conditional_get("https://api.github.com/large", {"Authorization": "Bearer a"})
+    await github_client._conditional_get("https://api.github.com/small", {"Authorization": "Bearer a"})
+
+    # Oversized bodies are not kept, and credentials are only stored as a digest
+    assert [key[0] for key in github_client._etag_cache] == ["https://api.github.com/small"]
+    assert all("Bearer a" not in str(key) for key in github_client._etag_cache)
+    assert github_client._etag_cache.currsize == 2 + github_api._ETAG_ENTRY_OVERHEAD
+
+
+@pytest.mark.asyncio
+async def test_get_session_reuses_pooled_session():
+    with patch("src.integrations.github.api.GitHubClient._decode_private_key", return_value="mock_key"):
+        client = GitHubClient()
+
+    session = await client._get_session()
+    try:
+        assert await client._get_session() is session
+        assert session.connector.limit_per_host == 64
+    finally:
+        await session.close()
+
+
+def test_pick_token_prefers_highest_remaining_rate_limit():
+    with patch("src.integrations.github.api.GitHubClient._decode_private_key", return_value="mock_key"):
+        client = GitHubClient()
+
+    # Unknown budgets rotate so every token gets probed
+    assert {client.pick_token(["a", "b"]), client.pick_token(["a", "b"])} == {"a", "b"}
+
+    client._record_rate_limit({"Authorization": "Bearer a"}, MagicMock(headers={"X-RateLimit-Remaining": "10"}))
+    client._record_rate_limit({"Authorization": "Bearer b"}, MagicMock(headers={"X-RateLimit-Remaining": "4000"}))
+
+    assert client.pick_token(["a", "b"]) == "b"
+    assert client.pick_token(["a", "b"]) == "b"
+
+
+def test_record_rate_limit_only_tracks_picked_tokens_by_digest():
+    with patch("src.integrations.github.api.GitHubClient._decode_private_key", return_value="mock_key"):
+        client = GitHubClient()
+
+    client._record_rate_limit({"Authorization": "Bearer install"}, MagicMock(headers={"X-RateLimit-Remaining": "9"}))
+    assert len(client._rate_limit_remaining) == 0
+
+    client.pick_token(["user"])
+    client._record_rate_limit({"Authorization": "Bearer user"}, MagicMock(headers={"X-RateLimit-Remaining": "9"}))
+    assert list(client._rate_limit_remaining.values()) == [9]
+    assert all("user" not in key for key in client._rate_limit_remaining)
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_backs_off_on_secondary_rate_limit(github_client, mock_aiohttp_session):
+    limited = mock_aiohttp_session.create_mock_response(403)
+    limited.headers = {"Retry-After": "2"}
+    ok = mock_aiohttp_session.create_mock_response(200)
+    ok.read = AsyncMock(return_value=b"[]")
+    mock_aiohttp_session.get.side_effect = [limited, ok]
+
+    with patch("src.integrations.github.api.asyncio.sleep", new=AsyncMock()) as sleep:
+        result = await github_client._conditional_get("https://api.github.com/x", {"Authorization": "Bearer a"})
+
+    assert result == (200, b"[]")
+    sleep.assert_awaited_once_with(2.0)
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_does_not_retry_plain_forbidden_or_long_waits(github_client, mock_aiohttp_session):
+    forbidden = mock_aiohttp_session.create_mock_response(403)
+    exhausted = mock_aiohttp_session.create_mock_response(403)
+    exhausted.headers = {"Retry-After": "3600"}
+    mock_aiohttp_session.get.side_effect = [forbidden, exhausted]
+
+    with patch("src.integrations.github.api.asyncio.sleep", new=AsyncMock()) as sleep:
+        assert await github_client._conditional_get("https://api.github.com/x", {}) == (403, None)
+        assert await github_client._conditional_get("https://api.github.com/y", {}) == (403, None)
+
+    sleep.assert_not_awaited()
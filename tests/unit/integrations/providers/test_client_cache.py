@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.integrations.providers import openai_provider, openrouter_provider
+from src.integrations.providers.openai_provider import OpenAIProvider
+from src.integrations.providers.openrouter_provider import OpenRouterProvider
+
+
+@pytest.fixture(params=[(openai_provider, OpenAIProvider), (openrouter_provider, OpenRouterProvider)])
+def provider_cls(request):
+    module, cls = request.param
+    # A fresh client object per constructor call, and an empty cache per test
+    with (
+        patch.object(module, "ChatOpenAI", side_effect=lambda **kwargs: MagicMock()),
+        patch.dict(module._CLIENT_CACHE, clear=True),
+    ):
+        yield cls
+
+
+def test_identical_configs_share_one_client(provider_cls):
+    first = provider_cls(model="gpt-4o", api_key="key", temperature=0.2).get_chat_model()
+    second = provider_cls(model="gpt-4o", api_key="key", temperature=0.2).get_chat_model()
+
+    assert first is second
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"api_key": "other-key"},
+        {"model": "gpt-4o-mini"},
+        {"temperature": 0.7},
+        {"max_tokens": 1024},
+        {"timeout": 30},
+    ],
+)
+def test_different_configs_get_separate_clients(provider_cls, changes):
+    base = {"model": "gpt-4o", "api_key": "key"}
+
+    first = provider_cls(**base).get_chat_model()
+    second = provider_cls(**{**base, **changes}).get_chat_model()
+
+    assert first is not second
+
+
+def test_unhashable_kwargs_still_produce_a_key(provider_cls):
+    kwargs = {"model_kwargs": {"stop": ["\n"], "extra": {"a": 1}}, "tags": ["agent"]}
+
+    first = provider_cls(model="gpt-4o", api_key="key", **kwargs)
+    second = provider_cls(
+        model="gpt-4o", api_key="key", tags=["agent"], model_kwargs={"extra": {"a": 1}, "stop": ["\n"]}
+    )
+
+    assert hash(first._config_key()) == hash(second._config_key())
+    assert first.get_chat_model() is second.get_chat_model()
+    assert provider_cls(model="gpt-4o", api_key="key", tags=["other"]).get_chat_model() is not first.get_chat_model()
@@ -96,6 +96,13 @@ class TestFilePatternCondition:
         assert FilePatternCondition._glob_to_regex("src/*.js") == "^src/.*\\.js$"
         assert FilePatternCondition._glob_to_regex("file?.txt") == "^file.\\.txt$"
 
+    def test_compile_glob_is_reused(self) -> None:
+        """Test compiled glob patterns are cached and match like the regex source."""
+        regex = FilePatternCondition._compile_glob("src/*.js")
+        assert regex is FilePatternCondition._compile_glob("src/*.js")
+        assert regex.match("src/app.js")
+        assert not regex.match("lib/app.js")
+
 
 class TestMaxFileSizeCondition:
     """Tests for MaxFileSizeCondition class."""
@@ -0,0 +1,208 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.models import Violation
+from src.services.standalone_analyzer import StandaloneAnalyzer
+from src.utils.github_url import GitHubRepoInfo
+
+
+@pytest.fixture
+def analyzer():
+    with patch("src.services.standalone_analyzer.get_agent", return_value=AsyncMock()):
+        return StandaloneAnalyzer(max_concurrent_prs=2)
+
+
+@pytest.fixture
+def repo_info():
+    return GitHubRepoInfo(owner="owner", repo="repo")
+
+
+@pytest.mark.asyncio
+async def test_analyze_latest_prs_keeps_input_order_and_bounds_concurrency(analyzer, repo_info):
+    prs = [{"number": n, "title": f"PR {n}"} for n in range(1, 6)]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fake_build_event_data(repo_full_name, pr, github_token, codeowners_content, bundle=None, **kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        # Later PRs finish first to check results are still reported in input order
+        await asyncio.sleep(0.01 * (10 - pr["number"]))
+        in_flight -= 1
+        return {"pull_request_details": pr}
+
+    async def _fake_evaluate_rules(rules, event_data):
+        number = event_data["pull_request_details"]["number"]
+        return [Violation(rule_description="rule", message=f"violation in {number}", pr_number=number)]
+
+    analyzer._fetch_open_prs = AsyncMock(return_value=prs)
+    analyzer._fetch_codeowners = AsyncMock(return_value=None)
+    analyzer._build_event_data = _fake_build_event_data
+    analyzer._evaluate_rules = _fake_evaluate_rules
+
+    result = await analyzer._analyze_latest_prs(repo_info, [], 1, None, max_prs=5, start_time=0.0)
+
+    assert result.success is True
+    assert [pr["number"] for pr in result.prs_analyzed] == [1, 2, 3, 4, 5]
+    assert [v.pr_number for v in result.violations] == [1, 2, 3, 4, 5]
+    assert max_in_flight == 2
+    # Violations are serialized once per PR and reused for the top-level list
+    assert [v["pr_number"] for v in result.violations_data()] == [1, 2, 3, 4, 5]
+    assert result.violations_data()[0] is result.prs_analyzed[0]["violations"][0]
+
+
+@pytest.mark.asyncio
+async def test_analyze_latest_prs_records_per_pr_errors(analyzer, repo_info):
+    prs = [{"number": 1, "title": "ok"}, {"number": 2, "title": "broken"}]
+
+    async def _fake_build_event_data(repo_full_name, pr, github_token, codeowners_content, bundle=None, **kwargs):
+        if pr["number"] == 2:
+            raise RuntimeError("boom")
+        return {"pull_request_details": pr}
+
+    analyzer._fetch_open_prs = AsyncMock(return_value=prs)
+    analyzer._fetch_codeowners = AsyncMock(return_value=None)
+    analyzer._build_event_data = _fake_build_event_data
+    analyzer._evaluate_rules = AsyncMock(return_value=[])
+
+    result = await analyzer._analyze_latest_prs(repo_info, [], 1, None, max_prs=2, start_time=0.0)
+
+    assert result.success is True
+    assert result.prs_analyzed[0] == {"number": 1, "title": "ok", "violations_count": 0, "violations": []}
+    assert result.prs_analyzed[1]["error"] == "boom"
+    assert result.prs_analyzed[1]["violations_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_codeowners_is_cached_per_repo_and_token(analyzer):
+    analyzer.github_client.get_file_content = AsyncMock(side_effect=[None, "* @owner", "* @other"])
+
+    assert await analyzer._fetch_codeowners("owner/repo", "token") == "* @owner"
+    assert await analyzer._fetch_codeowners("owner/repo", "token") == "* @owner"
+    assert analyzer.github_client.get_file_content.await_count == 2
+
+    # A different token must not be served another caller's cached content
+    assert await analyzer._fetch_codeowners("owner/repo", "other-token") == "* @other"
+
+
+@pytest.mark.asyncio
+async def test_fetch_codeowners_does_not_cache_after_transient_error(analyzer):
+    analyzer.github_client.get_file_content = AsyncMock(
+        side_effect=[RuntimeError("502"), None, None, "* @owner", None, None, None]
+    )
+
+    # First probe failed and nothing was found; the miss must not be cached
+    assert await analyzer._fetch_codeowners("owner/repo", "token") is None
+    assert await analyzer._fetch_codeowners("owner/repo", "token") == "* @owner"
+
+    # All paths 404 is a real answer and is cached
+    assert await analyzer._fetch_codeowners("owner/other", "token") is None
+    assert await analyzer._fetch_codeowners("owner/other", "token") is None
+    assert analyzer.github_client.get_file_content.await_count == 7
+
+
+def test_parse_rules_from_yaml_returns_fresh_lists(analyzer):
+    content = (
+        "rules:\n"
+        '  - description: "PRs need a linked issue"\n    enabled: true\n    severity: high\n'
+        "    event_types: [pull_request]\n"
+    )
+
+    first = analyzer._parse_rules_from_yaml(content)
+    second = analyzer._parse_rules_from_yaml(content)
+
+    assert [r.description for r in first] == ["PRs need a linked issue"]
+    assert first == second
+    assert first is not second
+    assert analyzer._parse_rules_from_yaml("not: [rules") == []
+
+
+def test_parse_rules_from_yaml_skips_parser_for_content_without_rules(analyzer):
+    with patch("src.services.standalone_analyzer._parse_rules_cached") as parse:
+        assert analyzer._parse_rules_from_yaml("") == []
+        assert analyzer._parse_rules_from_yaml("   \n") == []
+        assert analyzer._parse_rules_from_yaml("other: value\n") == []
+
+    parse.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_load_rules_local_fallback_picks_up_file_changes(analyzer, tmp_path, monkeypatch):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text('rules:\n  - description: "first"\n    event_types: [pull_request]\n')
+    monkeypatch.setattr(StandaloneAnalyzer, "LOCAL_RULES_PATH", rules_file)
+    analyzer._fetch_rules_content = AsyncMock(return_value=None)
+
+    assert [r.description for r in await analyzer._load_rules("owner/repo", None, None)] == ["first"]
+
+    rules_file.write_text('rules:\n  - description: "second"\n    event_types: [pull_request]\n')
+    os.utime(rules_file, ns=(0, rules_file.stat().st_mtime_ns + 1_000_000))
+
+    assert [r.description for r in await analyzer._load_rules("owner/repo", None, None)] == ["second"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_only_passes_pull_request_rules_to_engine(analyzer, repo_info):
+    content = (
+        "rules:\n"
+        '  - description: "pr rule"\n    event_types: [pull_request]\n'
+        '  - description: "push rule"\n    event_types: [push]\n'
+    )
+    analyzer.github_client.get_repository = AsyncMock(return_value={"full_name": "owner/repo"})
+    # analyze() resolves headers and the shared session up front; keep it off the real network pool
+    analyzer.github_client._get_auth_headers = AsyncMock(return_value={})
+    analyzer.github_client._get_session = AsyncMock(return_value=MagicMock())
+    analyzer._fetch_pr_data = AsyncMock(return_value={"number": 1, "title": "PR"})
+    analyzer._fetch_codeowners = AsyncMock(return_value=None)
+    analyzer._build_event_data = AsyncMock(return_value={"pull_request_details": {"number": 1}})
+    analyzer.engine_agent.execute = AsyncMock(return_value=AsyncMock(data={}))
+
+    result = await analyzer.analyze(repo_info, pr_number=1, rules_yaml=content)
+
+    assert result.rules_loaded == 2
+    rules = analyzer.engine_agent.execute.await_args.kwargs["rules"]
+    assert [r.description for r in rules] == ["pr rule"]
+
+
+@pytest.mark.asyncio
+async def test_evaluate_rules_skips_engine_without_rules(analyzer):
+    analyzer.engine_agent.execute = AsyncMock()
+
+    assert await analyzer._evaluate_rules([], {"pull_request_details": {"number": 1}}) == []
+    analyzer.engine_agent.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_local_rules_reads_file_once_per_mtime(analyzer, tmp_path):
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text('rules:\n  - description: "local"\n    event_types: [pull_request]\n')
+
+    with patch("src.services.standalone_analyzer.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+        first = await analyzer._read_local_rules(rules_file)
+        second = await analyzer._read_local_rules(rules_file)
+
+    assert [r.description for r in first] == ["local"]
+    assert second is first
+    assert to_thread.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_build_event_data_projects_changed_files(analyzer):
+    bundle = {
+        "reviews": [],
+        "files": [
+            {"filename": "a.py", "status": "added", "additions": 3, "deletions": 0, "patch": "..."},
+            {"filename": "b.py", "status": "modified"},
+        ],
+    }
+
+    event_data = await analyzer._build_event_data("owner/repo", {"number": 1}, "token", bundle=bundle)
+
+    assert event_data["changed_files"] == [
+        {"filename": "a.py", "status": "added", "additions": 3, "deletions": 0},
+        {"filename": "b.py", "status": "modified", "additions": None, "deletions": None},
+    ]
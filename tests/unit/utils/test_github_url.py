@@ -0,0 +1,52 @@
+import pytest
+
+from src.utils.github_url import GitHubRepoInfo, GitHubURLParser
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://github.com/owner/repo", GitHubRepoInfo("owner", "repo")),
+        ("https://github.com/owner/repo/", GitHubRepoInfo("owner", "repo")),
+        ("http://github.com/owner/repo", GitHubRepoInfo("owner", "repo")),
+        ("https://github.com/owner/repo.git", GitHubRepoInfo("owner", "repo")),
+        ("https://github.com/owner/repo/tree/main", GitHubRepoInfo("owner", "repo", branch="main")),
+        ("https://github.com/owner/repo/blob/dev", GitHubRepoInfo("owner", "repo", branch="dev")),
+        ("https://github.com/owner/repo/pull/42", GitHubRepoInfo("owner", "repo", pr_number=42)),
+        ("https://github.com/owner/repo/pull/42/", GitHubRepoInfo("owner", "repo", pr_number=42)),
+        ("github.com/owner/repo", GitHubRepoInfo("owner", "repo")),
+        ("github.com/owner/repo.git", GitHubRepoInfo("owner", "repo")),
+        ("github.com/owner/repo/pull/7", GitHubRepoInfo("owner", "repo", pr_number=7)),
+        ("github.com/owner/repo/tree/x", GitHubRepoInfo("owner", "repo", branch="x")),
+        ("git@github.com:owner/repo.git", GitHubRepoInfo("owner", "repo")),
+        ("git@github.com:owner/repo", GitHubRepoInfo("owner", "repo")),
+        ("owner/repo", GitHubRepoInfo("owner", "repo")),
+        ("my-org/my.repo", GitHubRepoInfo("my-org", "my.repo")),
+        ("  owner/repo  ", GitHubRepoInfo("owner", "repo")),
+    ],
+)
+def test_parse_supported_formats(url, expected):
+    assert GitHubURLParser.parse(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "",
+        "owner",
+        "owner/repo/extra",
+        "own er/repo",
+        "not a repo url",
+        "https://github.com/owner",
+        "https://github.com/owner/repo/issues/1",
+        "https://github.com/owner/repo/pull/abc",
+        "https://gitlab.com/owner/repo",
+        "HTTPS://github.com/owner/repo",
+        "ftp://github.com/owner/repo",
+        "www.github.com/owner/repo",
+        "git@gitlab.com:owner/repo",
+    ],
+)
+def test_parse_rejects_invalid_input(url):
+    assert GitHubURLParser.parse(url) is None
+    assert GitHubURLParser.is_valid_github_url(url) is False